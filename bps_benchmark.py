@@ -0,0 +1,347 @@
+"""
+Benchmark BPS Data Checker terhadap server tiruan WebAPI BPS lokal
+Mengukur wall time, request/detik, latensi p50/p95 dan peak RSS tanpa
+menyentuh webapi.bps.go.id
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import re
+import resource
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from concurrent.futures import ThreadPoolExecutor
+
+from bps_data_checker import (BPSDataChecker, CATEGORIES, PROVINCE_DOMAINS, RateLimiter, RequestCoalescer,
+                               RequestScheduler, percentile)
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    # Backlog default (5) membuat SYN dibuang saat banyak koneksi dibuka
+    # bersamaan, sehingga klien menunggu retransmit ~1 detik
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class MockWebAPI:
+    """
+    Server HTTP lokal yang meniru endpoint /list/model/ WebAPI BPS dengan
+    latensi, jumlah halaman dan tingkat error yang dapat diatur
+    """
+
+    def __init__(self, latency=0.05, pages=1, per_page=10, error_rate=0.0, seed=0):
+        """
+        Args:
+            latency (float): Latensi setiap response dalam detik
+            pages (int): Jumlah halaman setiap list/model
+            per_page (int): Jumlah item per halaman
+            error_rate (float): Peluang response 503 (0-1)
+            seed (int): Seed random agar hasil dapat diulang
+        """
+        self.latency = latency
+        self.pages = pages
+        self.per_page = per_page
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.server = None
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/v1/api"
+
+    def start(self):
+        """
+        Menjalankan server di thread latar belakang
+        """
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                mock._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = _MockHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """
+        Menghentikan server
+        """
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _handle(self, handler):
+        with self.lock:
+            self.requests += 1
+            failed = self.random.random() < self.error_rate
+        time.sleep(self.latency)
+
+        match = re.search(r'/list/model/(\w+)/domain/(\d+)/.*?/page/(\d+)', handler.path)
+        if failed or match is None:
+            handler.send_response(503 if failed else 404)
+            handler.end_headers()
+            return
+
+        model, domain, page = match.group(1), match.group(2), int(match.group(3))
+        body = json.dumps(self.list_page(model, domain, page)).encode('utf-8')
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def list_page(self, model, domain, page):
+        """
+        Membuat satu halaman response list/model dengan bentuk yang sama
+        seperti WebAPI BPS
+
+        Returns:
+            dict: Response JSON
+        """
+        spec = next((spec for spec in CATEGORIES.values() if spec['model'] == model), {})
+        id_field = spec.get('id_field') or 'id'
+        date_field = spec.get('date_field') or 'updt_date'
+        total = self.pages * self.per_page
+        start = (page - 1) * self.per_page
+        items = [
+            {
+                id_field: start + i + 1,
+                'title': f"{model.title()} {domain} nomor {start + i + 1}",
+                date_field: f"2026-{(start + i) % 12 + 1:02d}-01",
+            }
+            for i in range(min(self.per_page, max(0, total - start)))
+        ]
+        return {
+            'status': 'OK',
+            'data-availability': 'available',
+            'data': [
+                {'page': page, 'pages': self.pages, 'per_page': self.per_page, 'count': len(items), 'total': total},
+                items
+            ]
+        }
+
+
+def run_scenario(name, mock, run, **checker_kwargs):
+    """
+    Menjalankan satu skenario benchmark di proses anak (fork), agar peak RSS
+    yang dilaporkan hanya milik skenario tersebut. Server tiruan tetap
+    berjalan di proses ini.
+
+    Args:
+        name (str): Nama skenario
+        mock (MockWebAPI): Server tiruan yang sedang berjalan
+        run (callable): Fungsi yang menerima checker dan menjalankan pengecekan;
+            dict yang dikembalikannya ditambahkan ke hasil skenario
+        **checker_kwargs: Argumen tambahan BPSDataChecker
+
+    Returns:
+        dict: Wall time, jumlah request, request/detik, latensi p50/p95 dan peak RSS
+    """
+    reader, writer = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.get_context('fork').Process(
+        target=_scenario_process, args=(writer, mock.base_url, run, checker_kwargs)
+    )
+    requests_before = mock.requests
+    process.start()
+    writer.close()
+    try:
+        outcome = reader.recv()
+    except EOFError:
+        outcome = {'error': f"proses skenario berhenti dengan kode {process.exitcode}"}
+    process.join()
+    if 'error' in outcome:
+        raise RuntimeError(f"Skenario {name} gagal: {outcome['error']}")
+
+    wall_time = outcome['wall_time']
+    request_count = mock.requests - requests_before
+    latencies = outcome['latencies']
+    return {
+        'scenario': name,
+        'wall_time_s': round(wall_time, 3),
+        'requests': request_count,
+        'requests_per_s': round(request_count / wall_time, 1) if wall_time else 0.0,
+        'latency_p50_ms': round(percentile(latencies, 0.50) * 1000, 1),
+        'latency_p95_ms': round(percentile(latencies, 0.95) * 1000, 1),
+        'peak_rss_mb': outcome['peak_rss_mb'],
+        **(outcome['extra'] if isinstance(outcome['extra'], dict) else {}),
+    }
+
+
+def _scenario_process(conn, base_url, run, checker_kwargs):
+    """
+    Isi proses anak run_scenario: menjalankan skenario dan mengirim wall
+    time, latensi, peak RSS dan hasil tambahan lewat pipe
+    """
+    try:
+        latencies = []
+        checker = BPSDataChecker(api_key='benchmark', backoff_factor=0.01, **checker_kwargs)
+        checker.base_url = base_url
+        checker.session.hooks['response'].append(
+            lambda response, *args, **kwargs: latencies.append(response.elapsed.total_seconds())
+        )
+
+        start = time.perf_counter()
+        extra = run(checker)
+        wall_time = time.perf_counter() - start
+        conn.send({
+            'wall_time': wall_time,
+            'latencies': latencies,
+            # ru_maxrss dalam KB di Linux; puncak proses anak ini saja
+            'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+            'extra': extra,
+        })
+    except Exception as e:
+        conn.send({'error': repr(e)})
+    finally:
+        conn.close()
+
+
+def run_concurrent_callers(checker, callers):
+    """
+    Menjalankan check_all_data_availability untuk domain yang sama dari
+    beberapa pemanggil sekaligus (mis. dashboard dan job terjadwal)
+    """
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        list(executor.map(lambda _: checker.for_domain(checker.domain).check_all_data_availability(concurrent=True),
+                          range(callers)))
+
+
+def run_mixed(checker, domains, max_workers, interactive_checks=5):
+    """
+    Menjalankan crawl bulk banyak domain di latar belakang sambil mengukur
+    latensi pengecekan interaktif satu kategori di domain checker
+
+    Returns:
+        dict: Latensi p50/p95 pengecekan interaktif
+    """
+    bulk = threading.Thread(target=lambda: sum(1 for _ in checker.iter_availability(domains, max_workers=max_workers)))
+    bulk.start()
+    # Beri waktu crawl bulk memenuhi antrian request
+    time.sleep(0.05)
+    latencies = []
+    for _ in range(interactive_checks):
+        start = time.perf_counter()
+        checker.check_category('subjects', limit=5)
+        latencies.append(time.perf_counter() - start)
+    bulk.join()
+    return {
+        'interactive_p50_ms': round(percentile(latencies, 0.50) * 1000, 1),
+        'interactive_p95_ms': round(percentile(latencies, 0.95) * 1000, 1),
+    }
+
+
+def run_benchmarks(latency=0.05, pages=5, per_page=10, error_rate=0.0, max_workers=8, domains=None):
+    """
+    Menjalankan skenario satu domain, banyak domain dan pagination
+
+    Returns:
+        list: Hasil run_scenario untuk setiap skenario
+    """
+    domains = domains or list(PROVINCE_DOMAINS)
+    results = []
+
+    with MockWebAPI(latency=latency, pages=1, per_page=per_page, error_rate=error_rate) as mock:
+        results.append(run_scenario(
+            'single_domain_sequential', mock,
+            lambda checker: checker.check_all_data_availability()
+        ))
+        results.append(run_scenario(
+            'single_domain_concurrent', mock,
+            lambda checker: checker.check_all_data_availability(concurrent=True, max_workers=max_workers)
+        ))
+        results.append(run_scenario(
+            'multi_domain', mock,
+            lambda checker: sum(1 for _ in checker.iter_availability(domains, max_workers=max_workers)),
+            pool_size=max_workers
+        ))
+        results.append(run_scenario(
+            'concurrent_callers', mock,
+            lambda checker: run_concurrent_callers(checker, max_workers),
+            pool_size=max_workers
+        ))
+        results.append(run_scenario(
+            'concurrent_callers_coalesced', mock,
+            lambda checker: run_concurrent_callers(checker, max_workers),
+            pool_size=max_workers, coalescer=RequestCoalescer(ttl=0)
+        ))
+        # Budget request bersama (rate limit) lebih kecil dari kemampuan crawl bulk
+        rps = max_workers / latency / 2
+        results.append(run_scenario(
+            'mixed_fifo', mock,
+            lambda checker: run_mixed(checker, domains, max_workers),
+            pool_size=max_workers * 2, rate_limiter=RateLimiter(rps, burst=1)
+        ))
+        results.append(run_scenario(
+            'mixed_scheduled', mock,
+            lambda checker: run_mixed(checker, domains, max_workers),
+            pool_size=max_workers * 2, rate_limiter=RateLimiter(rps, burst=1),
+            scheduler=RequestScheduler(max_in_flight=max_workers)
+        ))
+
+    with MockWebAPI(latency=latency, pages=pages, per_page=per_page, error_rate=error_rate) as mock:
+        results.append(run_scenario(
+            'paginated', mock,
+            lambda checker: checker.check_all_data_availability(concurrent=True, max_workers=max_workers),
+            all_pages=True, page_workers=max_workers, pool_size=max_workers * 2
+        ))
+
+    return results
+
+
+def print_table(results):
+    """
+    Menampilkan hasil benchmark sebagai tabel
+    """
+    columns = ['scenario', 'wall_time_s', 'requests', 'requests_per_s', 'latency_p50_ms', 'latency_p95_ms', 'peak_rss_mb']
+    columns += [column for column in ('interactive_p50_ms', 'interactive_p95_ms') if any(column in row for row in results)]
+    widths = [max(len(column), *(len(str(row.get(column, '-'))) for row in results)) for column in columns]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+    print("  ".join("-" * width for width in widths))
+    for row in results:
+        print("  ".join(str(row.get(column, '-')).ljust(width) for column, width in zip(columns, widths)))
+
+
+def main(argv=None):
+    """
+    Fungsi utama benchmark
+    """
+    parser = argparse.ArgumentParser(description="Benchmark BPS Data Checker dengan server WebAPI tiruan")
+    parser.add_argument('--latency', type=float, default=50, help="Latensi per response dalam ms (default: 50)")
+    parser.add_argument('--pages', type=int, default=5, help="Jumlah halaman skenario pagination (default: 5)")
+    parser.add_argument('--per-page', type=int, default=10, help="Jumlah item per halaman (default: 10)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Peluang response 503, 0-1 (default: 0)")
+    parser.add_argument('--max-workers', type=int, default=8, help="Jumlah maksimal job bersamaan (default: 8)")
+    parser.add_argument('--domains', nargs='+', metavar='DOMAIN', help="Domain skenario multi domain (default: 34 provinsi)")
+    parser.add_argument('--json', metavar='PATH', help="Simpan hasil benchmark ke file JSON")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(latency=args.latency / 1000, pages=args.pages, per_page=args.per_page,
+                             error_rate=args.error_rate, max_workers=args.max_workers, domains=args.domains)
+    print_table(results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"[SAVE] Hasil benchmark disimpan ke: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""
+Entry point command line BPS Data Checker
+
+Memakai bps_data_checker dari cache bytecode sehingga --help dan perintah
+snapshot (summary, latest) langsung jalan tanpa mengimport stadata,
+pandas atau requests.
+
+    python bps_cli.py --domain 7500
+    python bps_cli.py summary bps_data_availability_7500_*.json
+    python bps_cli.py latest 7500
+"""
+
+import sys
+
+from bps_data_checker import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
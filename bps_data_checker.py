@@ -3,502 +3,4067 @@ BPS Data Availability Checker untuk Domain Gorontalo (7500)
 Fungsi sederhana untuk mengecek ketersediaan berbagai jenis data BPS
 """
 
-import stadata
-import requests
+# stadata (dan pandas), requests dan urllib3 diimport saat pertama dibutuhkan
+# agar import modul dan CLI untuk snapshot tetap cepat
 import json
-import pandas as pd
+import argparse
+import atexit
+import csv
+import functools
+import glob
+import hashlib
+import logging
+import random
+import re
+import socket
+import sqlite3
+import threading
+import time
+import gzip
+import queue
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
 from datetime import datetime
 import sys
 import os
 
-# Add stadata folder to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'stadata'))
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class BPSDataChecker:
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+
+def _import_stadata():
     """
-    Kelas untuk mengecek ketersediaan data BPS di berbagai kategori
+    Import stadata (beserta pandas) saat pertama kali dibutuhkan. Folder
+    stadata di samping modul ini ditambahkan ke sys.path sekali saja.
+    """
+    stadata_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stadata')
+    if stadata_dir not in sys.path:
+        sys.path.insert(0, stadata_dir)
+    import stadata
+    return stadata
+
+
+# Domain 34 provinsi BPS (kabupaten/kota dapat diambil lewat fetch_domain_list)
+PROVINCE_DOMAINS = {
+    '1100': 'Aceh',
+    '1200': 'Sumatera Utara',
+    '1300': 'Sumatera Barat',
+    '1400': 'Riau',
+    '1500': 'Jambi',
+    '1600': 'Sumatera Selatan',
+    '1700': 'Bengkulu',
+    '1800': 'Lampung',
+    '1900': 'Kepulauan Bangka Belitung',
+    '2100': 'Kepulauan Riau',
+    '3100': 'DKI Jakarta',
+    '3200': 'Jawa Barat',
+    '3300': 'Jawa Tengah',
+    '3400': 'DI Yogyakarta',
+    '3500': 'Jawa Timur',
+    '3600': 'Banten',
+    '5100': 'Bali',
+    '5200': 'Nusa Tenggara Barat',
+    '5300': 'Nusa Tenggara Timur',
+    '6100': 'Kalimantan Barat',
+    '6200': 'Kalimantan Tengah',
+    '6300': 'Kalimantan Selatan',
+    '6400': 'Kalimantan Timur',
+    '6500': 'Kalimantan Utara',
+    '7100': 'Sulawesi Utara',
+    '7200': 'Sulawesi Tengah',
+    '7300': 'Sulawesi Selatan',
+    '7400': 'Sulawesi Tenggara',
+    '7500': 'Gorontalo',
+    '7600': 'Sulawesi Barat',
+    '8100': 'Maluku',
+    '8200': 'Maluku Utara',
+    '9100': 'Papua Barat',
+    '9400': 'Papua',
+}
+
+DOMAIN_NAMES = {'0000': 'Indonesia', **PROVINCE_DOMAINS}
+
+# Status HTTP yang dicoba ulang dengan exponential backoff
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Kelas prioritas RequestScheduler, dari yang paling didahulukan:
+#   interactive - pengecekan yang ditunggu pengguna (default checker)
+#   bulk        - crawl banyak domain dan refresh latar belakang
+PRIORITY_CLASSES = ('interactive', 'bulk')
+
+# Katalog var_id,title variabel BPS yang dikirim bersama skrip ini
+VARIABLES_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bps_variables.csv')
+
+# Level detail hasil per kategori:
+#   summary - hanya jumlah, ID dan hash item sample
+#   samples - jumlah dan item sample (default)
+#   full    - seperti samples ditambah response mentah WebAPI (api_response)
+RESULT_LEVELS = ('summary', 'samples', 'full')
+
+# Awalan nama file hasil; snapshot check_changes memakai awalan sendiri agar
+# snapshot incremental terbaru dapat dicari tanpa membuka file hasil lain
+SNAPSHOT_PREFIX = 'bps_data_availability'
+INCREMENTAL_SNAPSHOT_PREFIX = 'bps_data_incremental'
+
+# Mode ResponseArchive: record menyimpan setiap response WebAPI sebagai run
+# baru, replay menjalankan pengecekan dari run tersimpan tanpa akses jaringan
+ARCHIVE_MODES = ('record', 'replay')
+
+# Kolom dataset Parquet (ParquetSink) dan kolom yang dapat dipakai sebagai partisi
+PARQUET_COLUMNS = ('run_ts', 'run_date', 'domain', 'category', 'status', 'total', 'item_id', 'title', 'updt_date')
+PARQUET_PARTITIONS = ('run_date', 'domain', 'category')
+
+# Registry kategori data BPS. Setiap entry mendeskripsikan satu model WebAPI:
+#   label      - nama kategori untuk pesan console
+#   model      - nama model di endpoint /list/model/{model}/
+#   id_field   - field ID item (untuk ringkasan dan deteksi perubahan)
+#   date_field - field tanggal update; dipakai mode incremental untuk berhenti
+#                mengambil halaman yang lebih lama dari snapshot sebelumnya
+#   count_key  - nama field jumlah total di hasil
+#   sample_key - nama field item sample di hasil
+#   stadata    - method stadata.Client untuk jalur DataFrame (use_stadata)
+#   default    - ikut dicek oleh check_all_data_availability (default: True)
+# Model baru cukup ditambahkan sebagai satu entry di sini.
+CATEGORIES = {
+    'static_tables': {
+        'label': 'Static Tables', 'model': 'statictable', 'id_field': 'table_id', 'date_field': 'updt_date',
+        'count_key': 'total_tables', 'sample_key': 'sample_tables', 'stadata': 'list_statictable',
+    },
+    'dynamic_tables': {
+        'label': 'Dynamic Tables', 'model': 'var', 'id_field': 'var_id', 'date_field': None,
+        'count_key': 'total_tables', 'sample_key': 'sample_tables', 'stadata': 'list_dynamictable',
+    },
+    'subjects': {
+        'label': 'Subjects', 'model': 'subject', 'id_field': 'sub_id', 'date_field': None,
+        'count_key': 'total_subjects', 'sample_key': 'sample_subjects',
+    },
+    'publications': {
+        'label': 'Publications', 'model': 'publication', 'id_field': 'pub_id', 'date_field': 'updt_date',
+        'count_key': 'total_publications', 'sample_key': 'sample_publications',
+    },
+    'press_releases': {
+        'label': 'Press Releases', 'model': 'pressrelease', 'id_field': 'brs_id', 'date_field': 'updt_date',
+        'count_key': 'total_press_releases', 'sample_key': 'sample_press_releases',
+    },
+    'strategic_indicators': {
+        'label': 'Strategic Indicators', 'model': 'strategicindicator', 'id_field': 'indicator_id', 'date_field': None,
+        'count_key': 'total_indicators', 'sample_key': 'sample_indicators',
+    },
+    'news': {
+        'label': 'News', 'model': 'news', 'id_field': 'news_id', 'date_field': 'rl_date',
+        'count_key': 'total_news', 'sample_key': 'sample_news',
+    },
+    'infographics': {
+        'label': 'Infographics', 'model': 'infographic', 'id_field': 'inf_id', 'date_field': None,
+        'count_key': 'total_infographics', 'sample_key': 'sample_infographics',
+    },
+    'glossary': {
+        'label': 'Glosarium', 'model': 'glosarium', 'id_field': '_id', 'date_field': None,
+        'count_key': 'total_glossary', 'sample_key': 'sample_glossary', 'default': False,
+    },
+}
+
+
+# Library diam secara default; CLI (atau aplikasi) memasang handler lewat configure_logging
+logger = logging.getLogger('bps_data_checker')
+logger.addHandler(logging.NullHandler())
+
+LOG_FORMATS = ('text', 'json')
+
+_log_listener = None
+_log_lock = threading.Lock()
+
+
+def _log_event(level, event, message, *args, **fields):
     """
+    Mencatat satu event progres. Pesan hanya diformat jika level aktif,
+    dan field tambahan ikut ditulis pada format JSON.
+
+    Args:
+        level (int): Level logging, mis. logging.INFO
+        event (str): Nama event, mis. 'category_checked'
+        message (str): Pesan dengan placeholder %-style
+        *args: Argumen untuk placeholder pesan
+        **fields: Field tambahan (domain, category, status, ...)
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, message, *args, extra={'event': event, 'fields': fields})
 
-    def __init__(self, api_key, domain="7500"):
-        """
-        Inisialisasi dengan API key dan domain BPS
 
-        Args:
-            api_key (str): API key dari WebAPI BPS
-            domain (str): Domain ID BPS (default: "7500" untuk Gorontalo)
-        """
-        self.api_key = api_key
-        self.domain = domain
-        self.base_url = "https://webapi.bps.go.id/v1/api"
-        self.client = stadata.Client(api_key)
+class JsonLogFormatter(logging.Formatter):
+    """
+    Formatter satu objek JSON per baris (timestamp, level, event, pesan
+    tanpa tag seperti '[SUCCESS]', dan field tambahan event)
+    """
 
-    def check_static_tables(self, limit=10):
-        """
-        Mengecek ketersediaan Static Tables
+    def format(self, record):
+        entry = {
+            'timestamp': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname.lower(),
+            'event': getattr(record, 'event', None),
+            'message': re.sub(r'^(\[\w+\] )+', '', record.getMessage().strip()),
+        }
+        entry.update(getattr(record, 'fields', {}))
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
 
-        Args:
-            limit (int): Jumlah maksimal data yang ditampilkan
 
-        Returns:
-            dict: Informasi ketersediaan static tables
-        """
+class _BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler untuk QueueListener yang hanya flush ketika antrian log
+    sudah kosong, sehingga rentetan log ditulis sebagai satu blok
+    """
+
+    def __init__(self, stream, log_queue):
+        super().__init__(stream)
+        self.log_queue = log_queue
+
+    def emit(self, record):
+        if self.stream is None:
+            return
         try:
-            print(f"[CHECKING] Mengecek Static Tables untuk domain {self.domain}...")
+            self.stream.write(self.format(record) + self.terminator)
+            if self.log_queue.empty():
+                self.flush()
+        except BrokenPipeError:
+            # Pembaca pipe (mis. head) sudah berhenti, log berikutnya dibuang
+            self.stream = None
+        except Exception:
+            self.handleError(record)
+
 
-            # Menggunakan stadata library
-            data = self.client.list_statictable(all=False, domain=[self.domain])
+def configure_logging(level='INFO', fmt='text', stream=None):
+    """
+    Memasang handler log untuk progres checker. Thread pekerja hanya
+    memasukkan record ke antrian; satu thread latar belakang menulis ke
+    stream sehingga baris tidak saling tumpang tindih dan stdout tidak
+    memperlambat pengecekan.
+
+    Args:
+        level (str/int): Level minimum, mis. 'INFO', 'WARNING' (quiet) atau 'DEBUG'
+        fmt (str): 'text' (format console seperti biasa) atau 'json' (satu objek per baris)
+        stream: Stream tujuan (default: sys.stdout)
+
+    Returns:
+        logging.Logger: Logger 'bps_data_checker'
+    """
+    # logging.handlers cukup lambat diimport, hanya dibutuhkan di sini
+    import logging.handlers
+
+    global _log_listener
+    if fmt not in LOG_FORMATS:
+        raise ValueError(f"fmt harus salah satu dari {LOG_FORMATS}")
+
+    stop_logging()
+    log_queue = queue.SimpleQueue()
+    handler = _BufferedStreamHandler(stream or sys.stdout, log_queue)
+    handler.setFormatter(JsonLogFormatter() if fmt == 'json' else logging.Formatter('%(message)s'))
+
+    with _log_lock:
+        for old_handler in [h for h in logger.handlers if isinstance(h, logging.handlers.QueueHandler)]:
+            logger.removeHandler(old_handler)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        logger.setLevel(level.upper() if isinstance(level, str) else level)
+        logger.propagate = False
+        _log_listener = logging.handlers.QueueListener(log_queue, handler)
+        _log_listener.start()
+    return logger
+
+
+def stop_logging():
+    """
+    Menulis semua log yang masih di antrian dan menghentikan thread log
+    (dipanggil otomatis saat proses selesai)
+    """
+    global _log_listener
+    with _log_lock:
+        listener, _log_listener = _log_listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
 
-            # Perbaiki pengecekan DataFrame
-            total_count = 0
-            sample_data = []
-            if data is not None and not data.empty:
-                total_count = len(data)
-                sample_data = data.head(limit).to_dict('records')
 
-            result = {
-                'status': 'success',
-                'total_tables': total_count,
-                'sample_tables': sample_data,
-                'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+atexit.register(stop_logging)
 
-            print(f"[SUCCESS] Ditemukan {total_count} Static Tables")
-            return result
 
-        except Exception as e:
-            print(f"[ERROR] Error checking static tables: {str(e)}")
-            return {
-                'status': 'error',
-                'error': str(e),
-                'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+class RateLimiter:
+    """
+    Token bucket sederhana untuk membatasi jumlah request per detik.
+    Aman dipakai bersama oleh banyak thread dan banyak checker.
+    """
 
-    def check_dynamic_tables(self, limit=10):
+    def __init__(self, requests_per_second, burst=None):
         """
-        Mengecek ketersediaan Dynamic Tables (Data)
-
         Args:
-            limit (int): Jumlah maksimal data yang ditampilkan
+            requests_per_second (float): Jumlah request yang diizinkan per detik
+            burst (int): Jumlah token maksimal yang boleh terkumpul
+                (default: sama dengan requests_per_second, minimal 1)
+        """
+        self.rate = float(requests_per_second)
+        self.capacity = float(burst or max(1, requests_per_second))
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def set_rate(self, requests_per_second, burst=None):
+        """
+        Mengubah batas request per detik tanpa membuat limiter baru
+        """
+        with self.lock:
+            self.rate = float(requests_per_second)
+            self.capacity = float(burst or max(1, requests_per_second))
+            self.tokens = min(self.tokens, self.capacity)
+
+    def pause(self, seconds):
+        """
+        Menahan semua request selama beberapa detik, mis. saat server
+        mengirim Retry-After
+        """
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def try_acquire(self):
+        """
+        Memakai satu token jika tersedia, tanpa menunggu
 
         Returns:
-            dict: Informasi ketersediaan dynamic tables
+            float: 0 jika token dipakai, atau jeda (detik) sampai token berikutnya
         """
-        try:
-            print(f"[CHECKING] Mengecek Dynamic Tables untuk domain {self.domain}...")
+        with self.lock:
+            now = time.monotonic()
+            if now < self.paused_until:
+                return self.paused_until - now
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """
+        Menunggu sampai satu token tersedia lalu memakainya
+        """
+        while True:
+            wait = self.try_acquire()
+            if not wait:
+                return
+            time.sleep(wait)
 
-            # Menggunakan stadata library
-            data = self.client.list_dynamictable(all=False, domain=[self.domain])
 
-            # Perbaiki pengecekan DataFrame
-            total_count = 0
-            sample_data = []
-            if data is not None and not data.empty:
-                total_count = len(data)
-                sample_data = data.head(limit).to_dict('records')
+class AdaptiveConcurrency:
+    """
+    Pengendali jumlah request bersamaan dengan pola AIMD (additive increase,
+    multiplicative decrease). Batas naik satu setiap satu "jendela" request
+    yang sehat, dan turun setengah saat ada 429/5xx, error koneksi atau
+    latensi di atas target.
+    """
 
-            result = {
-                'status': 'success',
-                'total_tables': total_count,
-                'sample_tables': sample_data,
-                'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+    def __init__(self, initial=4, minimum=1, maximum=32, latency_target=2.0, decrease_factor=0.5):
+        """
+        Args:
+            initial (int): Batas request bersamaan awal, dipotong ke
+                rentang [minimum, maximum]
+            minimum (int): Batas bawah
+            maximum (int): Batas atas
+            latency_target (float): Latensi (detik) yang masih dianggap sehat
+            decrease_factor (float): Faktor pengali saat terjadi kemacetan
+        """
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self.last_decrease = 0.0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        """
+        Menunggu sampai jumlah request berjalan di bawah batas saat ini
+        """
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
 
-            print(f"[SUCCESS] Ditemukan {total_count} Dynamic Tables")
-            return result
+    def release(self, latency, status_code=None, error=False):
+        """
+        Mencatat selesainya satu request dan menyesuaikan batas
 
-        except Exception as e:
-            print(f"[ERROR] Error checking dynamic tables: {str(e)}")
-            return {
-                'status': 'error',
-                'error': str(e),
-                'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+        Args:
+            latency (float): Durasi request dalam detik
+            status_code (int): Status HTTP (None jika error koneksi)
+            error (bool): True jika request gagal tanpa response
+        """
+        with self.condition:
+            self.in_flight -= 1
+            self._adjust(latency, status_code, error)
+            self.condition.notify_all()
 
-    def check_publications(self, limit=10):
+    def observe(self, latency, status_code=None, error=False):
         """
-        Mengecek ketersediaan Publications
+        Menyesuaikan batas dari hasil satu request tanpa memakai slot
+        pengendali ini, mis. saat slot diatur RequestScheduler
 
         Args:
-            limit (int): Jumlah maksimal data yang ditampilkan
+            latency (float): Durasi request dalam detik
+            status_code (int): Status HTTP (None jika error koneksi)
+            error (bool): True jika request gagal tanpa response
 
         Returns:
-            dict: Informasi ketersediaan publications
+            int: Batas request bersamaan yang baru
         """
-        try:
-            print(f"[CHECKING] Mengecek Publications untuk domain {self.domain}...")
-
-            # Menggunakan requests langsung karena stadata mungkin belum support
-            url = f"{self.base_url}/list/model/publication/domain/{self.domain}/key/{self.api_key}"
-            response = requests.get(url)
-            response.raise_for_status()
+        with self.condition:
+            self._adjust(latency, status_code, error)
+            return int(self.limit)
+
+    def _adjust(self, latency, status_code, error):
+        congested = error or status_code in RETRY_STATUS_CODES or latency > self.latency_target
+        now = time.monotonic()
+        if congested:
+            # Turunkan paling banyak sekali per periode latensi agar satu
+            # gelombang error tidak langsung menjatuhkan batas ke minimum
+            if now - self.last_decrease > self.latency_target:
+                self.limit = max(self.minimum, self.limit * self.decrease_factor)
+                self.last_decrease = now
+        else:
+            self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
 
-            data = response.json()
 
-            total_count = 0
-            if 'data' in data and len(data['data']) > 1:
-                # Data biasanya ada di index 1 dari array data
-                publications = data['data'][1] if len(data['data']) > 1 else []
-                total_count = len(publications)
+class RequestScheduler:
+    """
+    Penjadwal giliran request WebAPI dengan kelas prioritas. Request
+    'interactive' selalu mendapat slot (dan token rate limit) berikutnya
+    sebelum request 'bulk', dan sebagian slot dicadangkan untuknya sehingga
+    crawl bulk tidak pernah memakai seluruh slot. Di dalam satu kelas, domain
+    dilayani bergiliran agar satu domain besar tidak memonopoli antrian.
+    Request yang belum mendapat giliran saat deadline-nya lewat dibatalkan.
+    """
 
-            result = {
-                'status': 'success',
-                'total_publications': total_count,
-                'sample_publications': publications[:limit] if publications else [],
-                'api_response': data,
-                'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+    def __init__(self, max_in_flight=8, reserved_interactive=1):
+        """
+        Args:
+            max_in_flight (int): Jumlah maksimal request berjalan bersamaan
+            reserved_interactive (int): Jumlah slot yang hanya boleh dipakai
+                request interactive
+        """
+        if not 0 <= reserved_interactive < max_in_flight:
+            raise ValueError("reserved_interactive harus di antara 0 dan max_in_flight - 1")
+        self.max_in_flight = max_in_flight
+        self.reserved_interactive = reserved_interactive
+        self.in_flight = 0
+        self.condition = threading.Condition()
+        # Per kelas: domain -> antrian waiter, urutan dict = giliran domain
+        self.queues = {priority: OrderedDict() for priority in PRIORITY_CLASSES}
+        self.sequence = 0
+        self.stats = {'granted': dict.fromkeys(PRIORITY_CLASSES, 0), 'expired': 0}
+
+    def _head(self):
+        """
+        Waiter berikutnya: kelas prioritas tertinggi, domain terdepan dalam giliran
+        """
+        for priority in PRIORITY_CLASSES:
+            waiters_by_domain = self.queues[priority]
+            if waiters_by_domain:
+                return next(iter(waiters_by_domain.values()))[0]
+        return None
 
-            print(f"[SUCCESS] Ditemukan {total_count} Publications")
-            return result
+    def _dequeue(self, waiter, granted):
+        """
+        Menghapus waiter dari antrian. Domain yang baru mendapat giliran
+        dipindah ke belakang agar domain lain dilayani lebih dulu.
+        """
+        priority, domain, _ = waiter
+        waiters_by_domain = self.queues[priority]
+        waiters = waiters_by_domain[domain]
+        waiters.remove(waiter)
+        if not waiters:
+            del waiters_by_domain[domain]
+        elif granted:
+            waiters_by_domain.move_to_end(domain)
+
+    def acquire(self, priority='interactive', domain=None, deadline=None, rate_limiter=None):
+        """
+        Menunggu giliran untuk satu request. Setiap acquire yang berhasil
+        harus diikuti release().
 
-        except Exception as e:
-            print(f"[ERROR] Error checking publications: {str(e)}")
-            return {
-                'status': 'error',
-                'error': str(e),
-                'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+        Args:
+            priority (str): Kelas prioritas: 'interactive' atau 'bulk'
+            domain (str): Domain request, untuk giliran antar domain
+            deadline (float): Batas waktu dalam time.monotonic() (optional)
+            rate_limiter (RateLimiter): Limiter yang tokennya diambil saat
+                giliran tiba (optional)
+
+        Raises:
+            TimeoutError: Jika deadline lewat sebelum request mendapat giliran
+        """
+        if priority not in PRIORITY_CLASSES:
+            raise ValueError(f"priority harus salah satu dari {PRIORITY_CLASSES}")
+        with self.condition:
+            self.sequence += 1
+            waiter = (priority, domain, self.sequence)
+            self.queues[priority].setdefault(domain, deque()).append(waiter)
+            try:
+                while True:
+                    wait = None
+                    limit = self.max_in_flight if priority == 'interactive' else self.max_in_flight - self.reserved_interactive
+                    if self._head() == waiter and self.in_flight < limit:
+                        wait = rate_limiter.try_acquire() if rate_limiter is not None else 0.0
+                        if not wait:
+                            self._dequeue(waiter, granted=True)
+                            self.in_flight += 1
+                            self.stats['granted'][priority] += 1
+                            # Waiter berikutnya kini berada di depan antrian
+                            self.condition.notify_all()
+                            return
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self.stats['expired'] += 1
+                            raise TimeoutError(f"Deadline terlewati sebelum request domain {domain} mendapat giliran")
+                        wait = remaining if wait is None else min(wait, remaining)
+                    self.condition.wait(wait)
+            except BaseException:
+                self._dequeue(waiter, granted=False)
+                self.condition.notify_all()
+                raise
+
+    def release(self):
+        """
+        Mencatat selesainya satu request dan memberi giliran ke waiter berikutnya
+        """
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
 
-    def check_press_releases(self, limit=10):
+    def set_max_in_flight(self, max_in_flight):
         """
-        Mengecek ketersediaan Press Releases
+        Mengubah jumlah maksimal request berjalan, mis. dari batas AIMD.
+        Slot cadangan interactive tetap dipertahankan, sehingga batas tidak
+        pernah turun di bawah reserved_interactive + 1.
 
         Args:
-            limit (int): Jumlah maksimal data yang ditampilkan
-
-        Returns:
-            dict: Informasi ketersediaan press releases
+            max_in_flight (int): Batas baru
         """
-        try:
-            print(f"[CHECKING] Mengecek Press Releases untuk domain {self.domain}...")
+        with self.condition:
+            max_in_flight = max(int(max_in_flight), self.reserved_interactive + 1)
+            if max_in_flight != self.max_in_flight:
+                self.max_in_flight = max_in_flight
+                self.condition.notify_all()
+
+    @property
+    def waiting(self):
+        """
+        Jumlah request yang sedang menunggu giliran per kelas prioritas
+        """
+        with self.condition:
+            return {
+                priority: sum(len(waiters) for waiters in self.queues[priority].values())
+                for priority in PRIORITY_CLASSES
+            }
 
-            # Menggunakan requests langsung
-            url = f"{self.base_url}/list/model/pressrelease/domain/{self.domain}/key/{self.api_key}"
-            response = requests.get(url)
-            response.raise_for_status()
 
-            data = response.json()
+_shared_lock = threading.Lock()
+_shared_rate_limiter = None
+_shared_concurrency = None
+_shared_scheduler = None
+_shared_coalescer = None
 
-            total_count = 0
-            if 'data' in data and len(data['data']) > 1:
-                press_releases = data['data'][1] if len(data['data']) > 1 else []
-                total_count = len(press_releases)
 
-            result = {
-                'status': 'success',
-                'total_press_releases': total_count,
-                'sample_press_releases': press_releases[:limit] if press_releases else [],
-                'api_response': data,
-                'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+def shared_rate_limiter(requests_per_second=None, burst=None):
+    """
+    Rate limiter tunggal untuk seluruh proses, dipakai bersama oleh semua
+    checker agar total request ke WebAPI tetap dalam kuota
 
-            print(f"[SUCCESS] Ditemukan {total_count} Press Releases")
-            return result
+    Args:
+        requests_per_second (float): Batas baru (optional; default 10 saat
+            pertama kali dibuat)
+        burst (int): Jumlah token maksimal (optional)
 
-        except Exception as e:
-            print(f"[ERROR] Error checking press releases: {str(e)}")
-            return {
-                'status': 'error',
-                'error': str(e),
-                'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+    Returns:
+        RateLimiter: Limiter bersama
+    """
+    global _shared_rate_limiter
+    with _shared_lock:
+        if _shared_rate_limiter is None:
+            _shared_rate_limiter = RateLimiter(requests_per_second or 10, burst)
+        elif requests_per_second:
+            _shared_rate_limiter.set_rate(requests_per_second, burst)
+        return _shared_rate_limiter
 
-    def check_strategic_indicators(self, limit=10):
-        """
-        Mengecek ketersediaan Strategic Indicators
 
-        Args:
-            limit (int): Jumlah maksimal data yang ditampilkan
+def shared_concurrency(**kwargs):
+    """
+    Pengendali AIMD tunggal untuk seluruh proses
 
-        Returns:
-            dict: Informasi ketersediaan strategic indicators
-        """
-        try:
-            print(f"[CHECKING] Mengecek Strategic Indicators untuk domain {self.domain}...")
+    Args:
+        **kwargs: Argumen AdaptiveConcurrency, hanya dipakai saat pertama dibuat
 
-            # Menggunakan requests langsung
-            url = f"{self.base_url}/list/model/strategicindicator/domain/{self.domain}/key/{self.api_key}"
-            response = requests.get(url)
-            response.raise_for_status()
+    Returns:
+        AdaptiveConcurrency: Pengendali bersama
+    """
+    global _shared_concurrency
+    with _shared_lock:
+        if _shared_concurrency is None:
+            _shared_concurrency = AdaptiveConcurrency(**kwargs)
+        return _shared_concurrency
 
-            data = response.json()
 
-            total_count = 0
-            indicators_data = []
-            if 'data' in data and len(data['data']) > 1:
-                indicators_data = data['data'][1] if len(data['data']) > 1 else []
-                total_count = len(indicators_data)
+def shared_scheduler(**kwargs):
+    """
+    Scheduler tunggal untuk seluruh proses, agar pengecekan interaktif dan
+    crawl bulk dari checker yang berbeda berbagi satu antrian prioritas
 
-            result = {
-                'status': 'success',
-                'total_indicators': total_count,
-                'sample_indicators': indicators_data[:limit] if indicators_data else [],
-                'api_response': data,
-                'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+    Args:
+        **kwargs: Argumen RequestScheduler, hanya dipakai saat pertama dibuat
 
-            print(f"[SUCCESS] Ditemukan {total_count} Strategic Indicators")
-            return result
+    Returns:
+        RequestScheduler: Scheduler bersama
+    """
+    global _shared_scheduler
+    with _shared_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = RequestScheduler(**kwargs)
+        return _shared_scheduler
 
-        except Exception as e:
-            print(f"[ERROR] Error checking strategic indicators: {str(e)}")
-            return {
-                'status': 'error',
-                'error': str(e),
-                'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
 
-    def check_news(self, limit=10):
+class RequestCoalescer:
+    """
+    Single-flight untuk request identik: request yang sedang berjalan untuk
+    kunci yang sama dipakai bersama oleh semua pemanggil, lalu hasil parse-nya
+    disimpan sebentar di LRU memori. Nilai yang dikembalikan adalah objek yang
+    sama untuk semua pemanggil dan tidak boleh diubah.
+    """
+
+    def __init__(self, ttl=30, max_entries=1024):
         """
-        Mengecek ketersediaan News/Berita BPS
+        Args:
+            ttl (float): Lama hasil disimpan di memori dalam detik (0: hanya single-flight)
+            max_entries (int): Jumlah maksimal hasil di LRU memori
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.in_flight = {}
+        self.stats = {'hits': 0, 'coalesced': 0, 'misses': 0}
+
+    def get(self, key, loader, timeout=None):
+        """
+        Mengambil hasil untuk key dari memori, dari request yang sedang
+        berjalan, atau dengan memanggil loader
 
         Args:
-            limit (int): Jumlah maksimal data yang ditampilkan
+            key (str): Kunci request, mis. URL lengkap
+            loader (callable): Fungsi tanpa argumen yang mengambil data
+            timeout (float): Lama maksimal menunggu request yang sedang
+                berjalan milik pemanggil lain dalam detik (optional)
 
         Returns:
-            dict: Informasi ketersediaan news
+            tuple: (data, sumber) dengan sumber 'memory', 'coalesced' atau
+                None jika loader dijalankan oleh pemanggil ini
+
+        Raises:
+            TimeoutError: Jika request pemanggil lain belum selesai setelah timeout
         """
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self.entries.move_to_end(key)
+                    self.stats['hits'] += 1
+                    return value, 'memory'
+                del self.entries[key]
+
+            future = self.in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self.in_flight[key] = future
+                self.stats['misses'] += 1
+            else:
+                self.stats['coalesced'] += 1
+
+        if not leader:
+            try:
+                return future.result(timeout), 'coalesced'
+            except FutureTimeoutError:
+                # Request pemanggil lain (mis. crawl bulk yang masih antri)
+                # tetap berjalan; hanya pemanggil ini yang berhenti menunggu
+                raise TimeoutError("Deadline terlewati saat menunggu request identik yang sedang berjalan") from None
+
         try:
-            print(f"[CHECKING] Mengecek News untuk domain {self.domain}...")
+            value = loader()
+        except BaseException as e:
+            with self.lock:
+                del self.in_flight[key]
+            future.set_exception(e)
+            raise
+
+        with self.lock:
+            del self.in_flight[key]
+            if self.ttl > 0:
+                self.entries[key] = (time.monotonic() + self.ttl, value)
+                self.entries.move_to_end(key)
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+        future.set_result(value)
+        return value, None
+
+    def invalidate(self, key=None):
+        """
+        Menghapus hasil di memori untuk key (atau semua jika key None)
 
-            # Menggunakan requests langsung
-            url = f"{self.base_url}/list/model/news/domain/{self.domain}/key/{self.api_key}"
-            response = requests.get(url)
-            response.raise_for_status()
+        Args:
+            key (str): Kunci request (optional)
+        """
+        with self.lock:
+            if key is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(key, None)
 
-            data = response.json()
 
-            total_count = 0
-            news_data = []
-            if 'data' in data and len(data['data']) > 1:
-                news_data = data['data'][1] if len(data['data']) > 1 else []
-                total_count = len(news_data)
+def shared_coalescer(**kwargs):
+    """
+    Coalescer tunggal untuk seluruh proses, agar checker yang dibuat
+    terpisah (mis. dashboard dan job terjadwal) berbagi request yang sama
 
-            result = {
-                'status': 'success',
-                'total_news': total_count,
-                'sample_news': news_data[:limit] if news_data else [],
-                'api_response': data,
-                'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+    Args:
+        **kwargs: Argumen RequestCoalescer, hanya dipakai saat pertama dibuat
 
-            print(f"[SUCCESS] Ditemukan {total_count} News")
-            return result
+    Returns:
+        RequestCoalescer: Coalescer bersama
+    """
+    global _shared_coalescer
+    with _shared_lock:
+        if _shared_coalescer is None:
+            _shared_coalescer = RequestCoalescer(**kwargs)
+        return _shared_coalescer
 
-        except Exception as e:
-            print(f"[ERROR] Error checking news: {str(e)}")
-            return {
-                'status': 'error',
-                'error': str(e),
-                'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
 
-    def check_infographics(self, limit=10):
-        """
-        Mengecek ketersediaan Infographics
+def _parse_retry_after(value):
+    """
+    Membaca header Retry-After: jumlah detik atau HTTP-date
 
-        Args:
-            limit (int): Jumlah maksimal data yang ditampilkan
+    Returns:
+        float: Jeda dalam detik (minimal 0), atau None jika header kosong/tidak valid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    from email.utils import parsedate_to_datetime
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+# Timing request yang sedang berjalan di thread ini (diisi oleh koneksi
+# ter-instrumentasi saat membuka koneksi baru)
+_timing_context = threading.local()
+
+
+class _TimedConnectionMixin:
+    """
+    Mencatat waktu resolve DNS (dns_ms) dan connect TCP+TLS (connect_ms)
+    setiap koneksi baru ke timing request yang sedang berjalan di thread
+    yang sama. Host di-resolve sekali di _new_conn, lalu urllib3 membuka
+    koneksi ke alamat hasil resolve tersebut.
+    """
 
-        Returns:
-            dict: Informasi ketersediaan infographics
-        """
+    _dns_ms = 0.0
+
+    def connect(self):
+        timing = getattr(_timing_context, 'current', None)
+        self._dns_ms = 0.0
+        start = time.perf_counter()
+        super().connect()
+        if timing is not None:
+            elapsed = (time.perf_counter() - start) * 1000
+            timing['dns_ms'] = timing.get('dns_ms', 0.0) + self._dns_ms
+            timing['connect_ms'] = timing.get('connect_ms', 0.0) + elapsed - self._dns_ms
+
+    def _new_conn(self):
+        from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+        from urllib3.util.connection import allowed_gai_family
+
+        host = self._dns_host
+        start = time.perf_counter()
         try:
-            print(f"[CHECKING] Mengecek Infographics untuk domain {self.domain}...")
+            addresses = socket.getaddrinfo(host.strip('[]'), self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except (OSError, UnicodeError):
+            # Error resolve dilaporkan oleh urllib3 seperti biasa
+            return super()._new_conn()
+        self._dns_ms = (time.perf_counter() - start) * 1000
+
+        # Coba setiap alamat secara berurutan seperti create_connection urllib3;
+        # SNI dan verifikasi sertifikat tetap memakai self.host
+        error = None
+        for address in dict.fromkeys(sockaddr[0] for *_, sockaddr in addresses):
+            self._dns_host = address
+            try:
+                return super()._new_conn()
+            except (ConnectTimeoutError, NewConnectionError) as e:
+                error = e
+            finally:
+                self._dns_host = host
+        if error is None:
+            return super()._new_conn()
+        raise error
+
+
+@functools.lru_cache(maxsize=None)
+def _timed_adapter_class():
+    """
+    Membuat kelas TimedHTTPAdapter saat pertama dipakai, sehingga requests
+    dan urllib3 tidak diimport ketika modul ini diimport
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
-            # Menggunakan requests langsung
-            url = f"{self.base_url}/list/model/infographic/domain/{self.domain}/key/{self.api_key}"
-            response = requests.get(url)
-            response.raise_for_status()
+    class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+        pass
 
-            data = response.json()
+    class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+        pass
 
-            total_count = 0
-            if 'data' in data and len(data['data']) > 1:
-                infographics = data['data'][1] if len(data['data']) > 1 else []
-                total_count = len(infographics)
+    class _TimedHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = _TimedHTTPConnection
 
-            result = {
-                'status': 'success',
-                'total_infographics': total_count,
-                'sample_infographics': infographics[:limit] if infographics else [],
-                'api_response': data,
-                'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+    class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = _TimedHTTPSConnection
 
-            print(f"[SUCCESS] Ditemukan {total_count} Infographics")
-            return result
+    class TimedHTTPAdapter(HTTPAdapter):
+        """
+        HTTPAdapter yang memakai koneksi ter-instrumentasi (waktu connect)
+        """
 
-        except Exception as e:
-            print(f"[ERROR] Error checking infographics: {str(e)}")
-            return {
-                'status': 'error',
-                'error': str(e),
-                'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {
+                'http': _TimedHTTPConnectionPool,
+                'https': _TimedHTTPSConnectionPool,
             }
 
-    def check_subjects(self, limit=10):
-        """
-        Mengecek ketersediaan Subjects
+    return TimedHTTPAdapter
 
-        Args:
-            limit (int): Jumlah maksimal data yang ditampilkan
 
-        Returns:
-            dict: Informasi ketersediaan subjects
-        """
-        try:
-            print(f"[CHECKING] Mengecek Subjects untuk domain {self.domain}...")
+def __getattr__(name):
+    # Nama yang dulu diimport di level modul tetap tersedia, tetapi baru
+    # diimport saat pertama diakses
+    if name == 'TimedHTTPAdapter':
+        return _timed_adapter_class()
+    if name == 'stadata':
+        return _import_stadata()
+    if name == 'requests':
+        import requests
+        return requests
+    if name == 'pd':
+        import pandas
+        return pandas
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-            # Menggunakan requests langsung karena stadata tidak punya list_subject
-            url = f"{self.base_url}/list/model/subject/domain/{self.domain}/key/{self.api_key}"
-            response = requests.get(url)
-            response.raise_for_status()
 
-            data = response.json()
+def percentile(values, fraction):
+    """
+    Persentil sederhana (nearest-rank) dari daftar nilai
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
 
-            total_count = 0
-            subjects = []
-            if 'data' in data and len(data['data']) > 1:
-                subjects = data['data'][1] if len(data['data']) > 1 else []
-                total_count = len(subjects)
 
-            result = {
-                'status': 'success',
-                'total_subjects': total_count,
-                'sample_subjects': subjects[:limit] if subjects else [],
-                'api_response': data,
-                'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+class RequestMetrics:
+    """
+    Pengumpul timing per request (dipasang di BPSDataChecker.request_hooks).
+    Setiap entry berisi endpoint, domain, status, bytes, dns_ms, connect_ms,
+    ttfb_ms, total_ms, cache dan attempts.
+    """
 
-            print(f"[SUCCESS] Ditemukan {total_count} Subjects")
-            return result
+    def __init__(self, domain=None):
+        """
+        Args:
+            domain (str): Hanya catat request untuk domain ini (optional)
+        """
+        self.domain = domain
+        self.entries = []
+        self.lock = threading.Lock()
 
-        except Exception as e:
-            print(f"[ERROR] Error checking subjects: {str(e)}")
-            return {
-                'status': 'error',
-                'error': str(e),
-                'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+    def __call__(self, entry):
+        if self.domain is not None and entry['domain'] != self.domain:
+            return
+        with self.lock:
+            self.entries.append(entry)
 
-    def check_all_data_availability(self, limit_per_category=5):
+    def summary(self, domain=None, clear=False):
         """
-        Mengecek ketersediaan semua jenis data BPS secara menyeluruh
+        Ringkasan timing per endpoint
 
         Args:
-            limit_per_category (int): Jumlah maksimal sample per kategori
+            domain (str): Hanya ringkas request untuk domain ini (optional)
+            clear (bool): Hapus entry yang sudah diringkas
 
         Returns:
-            dict: Ringkasan ketersediaan semua data BPS
+            dict: Jumlah request, total waktu dan statistik per endpoint
         """
-        print("[START] Memulai pengecekan ketersediaan data BPS untuk Domain Gorontalo (7500)")
-        print("=" * 70)
+        with self.lock:
+            entries = [entry for entry in self.entries if domain is None or entry['domain'] == domain]
+            if clear:
+                self.entries = [entry for entry in self.entries if not (domain is None or entry['domain'] == domain)]
+
+        by_endpoint = {}
+        for entry in entries:
+            by_endpoint.setdefault(entry['endpoint'], []).append(entry)
+
+        return {
+            'requests': len(entries),
+            'total_ms': round(sum(entry['total_ms'] for entry in entries), 1),
+            'by_endpoint': {
+                endpoint: {
+                    'requests': len(items),
+                    'errors': sum(1 for item in items if item['error']),
+                    'cache_hits': sum(1 for item in items if item['cache'] in ('hit', 'revalidated', 'memory', 'coalesced')),
+                    'bytes': sum(item['bytes'] for item in items),
+                    'dns_ms': round(sum(item['dns_ms'] for item in items), 1),
+                    'connect_ms': round(sum(item['connect_ms'] for item in items), 1),
+                    'ttfb_p50_ms': round(percentile([item['ttfb_ms'] for item in items], 0.50), 1),
+                    'total_p50_ms': round(percentile([item['total_ms'] for item in items], 0.50), 1),
+                    'total_p95_ms': round(percentile([item['total_ms'] for item in items], 0.95), 1),
+                    'total_max_ms': round(max(item['total_ms'] for item in items), 1),
+                }
+                for endpoint, items in sorted(by_endpoint.items())
+            }
+        }
 
-        results = {
-            'domain': self.domain,
-            'domain_name': 'Gorontalo',
-            'check_timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+    def to_prometheus(self):
+        """
+        Ekspor metrik dalam format teks Prometheus (exposition format 0.0.4)
+
+        Returns:
+            str: Isi file metrik
+        """
+        with self.lock:
+            entries = list(self.entries)
+
+        requests_total = {}
+        durations = {}
+        response_bytes = {}
+        for entry in entries:
+            labels = (entry['endpoint'], entry['domain'])
+            status = 'error' if entry['error'] else str(entry['status'] or 'none')
+            key = labels + (status, entry['cache'] or 'none')
+            requests_total[key] = requests_total.get(key, 0) + 1
+            durations.setdefault(labels, []).append(entry['total_ms'] / 1000)
+            response_bytes[labels] = response_bytes.get(labels, 0) + entry['bytes']
+
+        def fmt(**labels):
+            return ','.join(f'{name}="{value}"' for name, value in labels.items())
+
+        lines = [
+            '# HELP bps_requests_total Jumlah request ke WebAPI/stadata',
+            '# TYPE bps_requests_total counter',
+        ]
+        for (endpoint, domain, status, cache), count in sorted(requests_total.items()):
+            lines.append(f'bps_requests_total{{{fmt(endpoint=endpoint, domain=domain, status=status, cache=cache)}}} {count}')
+
+        lines += [
+            '# HELP bps_request_duration_seconds Durasi request',
+            '# TYPE bps_request_duration_seconds summary',
+        ]
+        for (endpoint, domain), values in sorted(durations.items()):
+            for quantile in (0.5, 0.95):
+                lines.append(f'bps_request_duration_seconds{{{fmt(endpoint=endpoint, domain=domain, quantile=quantile)}}} '
+                             f'{percentile(values, quantile):.6f}')
+            lines.append(f'bps_request_duration_seconds_sum{{{fmt(endpoint=endpoint, domain=domain)}}} {sum(values):.6f}')
+            lines.append(f'bps_request_duration_seconds_count{{{fmt(endpoint=endpoint, domain=domain)}}} {len(values)}')
+
+        lines += [
+            '# HELP bps_response_bytes_total Jumlah byte response',
+            '# TYPE bps_response_bytes_total counter',
+        ]
+        for (endpoint, domain), total in sorted(response_bytes.items()):
+            lines.append(f'bps_response_bytes_total{{{fmt(endpoint=endpoint, domain=domain)}}} {total}')
+
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, filename):
+        """
+        Menyimpan metrik format Prometheus ke file (mis. untuk node_exporter
+        textfile collector)
+
+        Args:
+            filename (str): Lokasi file .prom
+        """
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        return filename
+
+
+class CheckpointJournal:
+    """
+    Journal checkpoint berformat JSON lines untuk melanjutkan run yang
+    terputus. Setiap kategori yang selesai (domain, kategori) dan setiap
+    halaman yang diambil pada mode all_pages (domain, model, halaman)
+    langsung ditambahkan dan di-flush ke file.
+    """
+
+    def __init__(self, path='bps_checkpoint.ndjson', resume=True):
+        """
+        Args:
+            path (str): Lokasi file journal
+            resume (bool): Muat journal yang sudah ada; jika False journal
+                lama dikosongkan
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.results = {}
+        self.pages = {}
+
+        if resume and os.path.exists(path):
+            complete_size = 0
+            with open(path, 'rb') as f:
+                for line in f:
+                    if line.endswith(b'\n'):
+                        complete_size += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Baris terakhir bisa terpotong jika proses dihentikan paksa
+                        continue
+                    if entry.get('type') == 'result':
+                        self.results[(entry['domain'], entry['category'])] = entry['result']
+                    elif entry.get('type') == 'page':
+                        self.pages[(entry['domain'], entry['model'], entry['page'])] = entry['data']
+            if complete_size < os.path.getsize(path):
+                # Buang baris terpotong agar entry berikutnya tidak tersambung ke baris itu
+                os.truncate(path, complete_size)
+
+        self.file = open(path, 'ab' if resume else 'wb')
+
+    def get_result(self, domain, category):
+        """
+        Hasil kategori yang sudah selesai pada run sebelumnya, atau None
+        """
+        return self.results.get((domain, category))
+
+    def record_result(self, domain, category, result):
+        """
+        Mencatat kategori yang sudah selesai
+        """
+        self.results[(domain, category)] = result
+        self._append({'type': 'result', 'domain': domain, 'category': category, 'result': result})
+
+    def get_page(self, domain, model, page):
+        """
+        Response halaman yang sudah diambil pada run sebelumnya, atau None
+        """
+        return self.pages.get((domain, model, page))
+
+    def record_page(self, domain, model, page, data):
+        """
+        Mencatat halaman list/model yang sudah diambil
+        """
+        self.pages[(domain, model, page)] = data
+        self._append({'type': 'page', 'domain': domain, 'model': model, 'page': page, 'data': data})
+
+    def close(self):
+        """
+        Menutup file journal
+        """
+        with self.lock:
+            self.file.close()
+
+    def _append(self, entry):
+        with self.lock:
+            self.file.write(dump_json_bytes(entry, compact=True) + b'\n')
+            self.file.flush()
+
+
+class ResponseCache:
+    """
+    Cache response WebAPI/stadata di file SQLite dengan TTL per kategori,
+    batas ukuran (eviction LRU) dan penyimpanan ETag/Last-Modified untuk
+    revalidasi bersyarat
+    """
+
+    def __init__(self, path='bps_cache.sqlite', ttl=None, default_ttl=3600, max_size=256 * 1024 * 1024):
+        """
+        Args:
+            path (str): Lokasi file SQLite cache
+            ttl (dict): TTL dalam detik per kategori/model, mis. {'news': 600}
+            default_ttl (int): TTL untuk kategori yang tidak ada di ttl
+            max_size (int): Ukuran maksimal total data tersimpan (byte)
+        """
+        self.path = path
+        self.ttl = dict(ttl or {})
+        self.default_ttl = default_ttl
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, category TEXT, body BLOB, size INTEGER,"
+            " etag TEXT, last_modified TEXT, stored_at REAL, accessed_at REAL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        self.conn.commit()
+
+    def get(self, key, category):
+        """
+        Mengambil entry cache, termasuk yang sudah kedaluwarsa (untuk revalidasi)
+
+        Args:
+            key (str): Kunci cache
+            category (str): Kategori/model untuk menentukan TTL
+
+        Returns:
+            dict: {'value', 'fresh', 'etag', 'last_modified'} atau None
+        """
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+
+        body, etag, last_modified, stored_at = row
+        return {
+            'value': json.loads(zlib.decompress(body)),
+            'fresh': now - stored_at < self.ttl.get(category, self.default_ttl),
+            'etag': etag,
+            'last_modified': last_modified,
+        }
+
+    def put(self, key, category, value, etag=None, last_modified=None):
+        """
+        Menyimpan value (harus bisa di-serialize ke JSON) ke cache
+
+        Args:
+            key (str): Kunci cache
+            category (str): Kategori/model
+            value: Data yang disimpan
+            etag (str): Header ETag dari server (optional)
+            last_modified (str): Header Last-Modified dari server (optional)
+        """
+        body = zlib.compress(json.dumps(value, ensure_ascii=False, default=_json_default).encode('utf-8'))
+        now = time.time()
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, category, body, len(body), etag, last_modified, now, now)
+            )
+            self._evict()
+            self.conn.commit()
+
+    def touch(self, key):
+        """
+        Menandai entry sebagai baru lagi setelah server membalas 304 Not Modified
+
+        Args:
+            key (str): Kunci cache
+        """
+        now = time.time()
+        with self.lock:
+            self.conn.execute("UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?", (now, now, key))
+            self.conn.commit()
+
+    def clear(self):
+        """
+        Menghapus semua entry cache
+        """
+        with self.lock:
+            self.conn.execute("DELETE FROM responses")
+            self.conn.commit()
+
+    def _evict(self):
+        """
+        Menghapus entry yang paling lama tidak diakses sampai ukuran total
+        di bawah max_size. Dipanggil dengan lock sudah dipegang.
+        """
+        total_size = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total_size <= self.max_size:
+            return
+        rows = self.conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            if total_size <= self.max_size:
+                break
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total_size -= size
+
+
+class ResponseArchive:
+    """
+    Arsip response mentah WebAPI di file SQLite untuk record/replay. Setiap
+    run live menjadi satu run arsip; body disimpan terkompresi zlib dan
+    hanya sekali untuk isi yang sama (antar URL maupun antar run), sehingga
+    sweep harian yang sebagian besar tidak berubah tetap kecil. Saat replay,
+    semua request dilayani dari satu run tanpa rate limit dan tanpa jaringan.
+    """
+
+    def __init__(self, path='bps_archive.sqlite', mode='record', run_id=None):
+        """
+        Args:
+            path (str): Lokasi file SQLite arsip
+            mode (str): 'record' (run baru) atau 'replay'
+            run_id (int): Run yang di-replay (default: run terakhir)
+        """
+        if mode not in ARCHIVE_MODES:
+            raise ValueError(f"mode harus salah satu dari {ARCHIVE_MODES}")
+        self.path = path
+        self.mode = mode
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS runs (run_id INTEGER PRIMARY KEY, started_at TEXT)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS bodies (hash TEXT PRIMARY KEY, body BLOB)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " run_id INTEGER, key TEXT, hash TEXT, PRIMARY KEY (run_id, key)) WITHOUT ROWID"
+        )
+
+        if mode == 'record':
+            self.started_at = datetime.now().replace(microsecond=0)
+            cursor = self.conn.execute("INSERT INTO runs (started_at) VALUES (?)",
+                                       (self.started_at.strftime('%Y-%m-%d %H:%M:%S'),))
+            self.run_id = cursor.lastrowid
+        else:
+            if run_id is None:
+                row = self.conn.execute("SELECT run_id, started_at FROM runs ORDER BY run_id DESC LIMIT 1").fetchone()
+            else:
+                row = self.conn.execute("SELECT run_id, started_at FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+            if row is None:
+                self.conn.close()
+                raise ValueError(f"Run {run_id if run_id is not None else 'terakhir'} tidak ada di arsip {path}")
+            self.run_id = row[0]
+            self.started_at = datetime.strptime(row[1], '%Y-%m-%d %H:%M:%S')
+        self.conn.commit()
+
+    @property
+    def replaying(self):
+        """
+        True jika arsip dipakai untuk replay
+        """
+        return self.mode == 'replay'
+
+    def record(self, key, body):
+        """
+        Menyimpan body response untuk key di run ini
+
+        Args:
+            key (str): Kunci request (path URL tanpa API key)
+            body (bytes): Body response mentah
+        """
+        digest = hashlib.sha1(body).hexdigest()
+        with self.lock:
+            if self.conn.execute("SELECT 1 FROM bodies WHERE hash = ?", (digest,)).fetchone() is None:
+                self.conn.execute("INSERT INTO bodies VALUES (?, ?)", (digest, zlib.compress(body, 9)))
+            self.conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (self.run_id, key, digest))
+            self.conn.commit()
+
+    def load(self, key):
+        """
+        Membaca body response untuk key dari run yang di-replay
+
+        Args:
+            key (str): Kunci request (path URL tanpa API key)
+
+        Returns:
+            bytes: Body response mentah
+
+        Raises:
+            LookupError: Jika key tidak terekam di run ini
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT bodies.body FROM responses JOIN bodies ON bodies.hash = responses.hash"
+                " WHERE responses.run_id = ? AND responses.key = ?", (self.run_id, key)
+            ).fetchone()
+        if row is None:
+            raise LookupError(f"Response {key} tidak ada di arsip run {self.run_id}")
+        return zlib.decompress(row[0])
+
+    def runs(self):
+        """
+        Daftar run di arsip
+
+        Returns:
+            list: Dict run_id, started_at dan jumlah response per run
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT runs.run_id, runs.started_at, COUNT(responses.key) FROM runs"
+                " LEFT JOIN responses ON responses.run_id = runs.run_id"
+                " GROUP BY runs.run_id ORDER BY runs.run_id"
+            ).fetchall()
+        return [{'run_id': run_id, 'started_at': started_at, 'responses': count}
+                for run_id, started_at, count in rows]
+
+    def close(self):
+        """
+        Menutup koneksi SQLite arsip
+        """
+        with self.lock:
+            self.conn.close()
+
+
+class CatalogIndex:
+    """
+    Indeks pencarian lokal (SQLite FTS5) atas judul, subjek, var_id dan
+    tanggal setiap item katalog yang diambil checker, untuk semua domain.
+    Jika SQLite tidak mendukung FTS5, pencarian memakai LIKE.
+    """
+
+    TITLE_FIELDS = ('title', 'name', 'judul', 'nama')
+    SUBJECT_FIELDS = ('subj', 'sub_name', 'subcat', 'subcsa_name', 'newscat_name', 'category')
+
+    def __init__(self, path='bps_index.sqlite'):
+        """
+        Args:
+            path (str): Lokasi file SQLite indeks
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            " id INTEGER PRIMARY KEY, domain TEXT, category TEXT, item_id TEXT, title TEXT,"
+            " subject TEXT, date TEXT, var_id TEXT, indexed_at REAL, UNIQUE (domain, category, item_id))"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS items_var ON items (var_id)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS items_date ON items (date)")
+        try:
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5("
+                " title, subject, content='items', content_rowid='id',"
+                " tokenize='unicode61 remove_diacritics 2')"
+            )
+            self.conn.executescript(
+                "CREATE TRIGGER IF NOT EXISTS items_ai AFTER INSERT ON items BEGIN"
+                "  INSERT INTO items_fts (rowid, title, subject) VALUES (new.id, new.title, new.subject);"
+                " END;"
+                "CREATE TRIGGER IF NOT EXISTS items_ad AFTER DELETE ON items BEGIN"
+                "  INSERT INTO items_fts (items_fts, rowid, title, subject) VALUES ('delete', old.id, old.title, old.subject);"
+                " END;"
+                "CREATE TRIGGER IF NOT EXISTS items_au AFTER UPDATE ON items BEGIN"
+                "  INSERT INTO items_fts (items_fts, rowid, title, subject) VALUES ('delete', old.id, old.title, old.subject);"
+                "  INSERT INTO items_fts (rowid, title, subject) VALUES (new.id, new.title, new.subject);"
+                " END;"
+            )
+            self.fts = True
+        except sqlite3.OperationalError:
+            self.fts = False
+        self.conn.commit()
+
+    def _row(self, domain, category, item, now):
+        """
+        Mengambil kolom indeks dari satu item katalog
+        """
+        spec = CATEGORIES.get(category, {})
+        source = item.get('_source') if isinstance(item.get('_source'), dict) else item
+        title = next((source[field] for field in self.TITLE_FIELDS if source.get(field)), '')
+        subject = next((source[field] for field in self.SUBJECT_FIELDS if source.get(field)), '')
+        date_field = spec.get('date_field')
+        date = item.get(date_field) if date_field else item.get('updt_date') or item.get('rl_date')
+        var_id = item.get('var_id') if item.get('var_id') is not None else item.get('var')
+        return (
+            domain, category, str(_item_key(item, spec.get('id_field'))), str(title), str(subject),
+            str(date)[:10] if date else None, str(var_id) if var_id not in (None, '') else None, now
+        )
+
+    def add_items(self, domain, category, items, replace=False):
+        """
+        Menambahkan (atau memperbarui) item katalog satu kategori di satu domain
+
+        Args:
+            domain (str): Domain ID BPS
+            category (str): Nama kategori di CATEGORIES
+            items (list): Item dari WebAPI/stadata
+            replace (bool): Hapus dulu item lama kategori ini (items berisi
+                daftar lengkap, sehingga item yang sudah dihapus ikut hilang)
+
+        Returns:
+            int: Jumlah item yang diindeks
+        """
+        now = time.time()
+        rows = [self._row(domain, category, item, now) for item in items if isinstance(item, dict)]
+        with self.lock:
+            if replace:
+                self.conn.execute("DELETE FROM items WHERE domain = ? AND category = ?", (domain, category))
+            self.conn.executemany(
+                "INSERT INTO items (domain, category, item_id, title, subject, date, var_id, indexed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (domain, category, item_id) DO UPDATE SET title = excluded.title,"
+                " subject = excluded.subject, date = excluded.date, var_id = excluded.var_id,"
+                " indexed_at = excluded.indexed_at",
+                rows
+            )
+            self.conn.commit()
+        return len(rows)
+
+    def add_results(self, results):
+        """
+        Mengindeks item sample dari hasil pengecekan yang sudah disimpan
+        (check_all_data_availability, check_domains atau check_changes)
+
+        Args:
+            results (dict): Hasil pengecekan satu domain
+
+        Returns:
+            int: Jumlah item yang diindeks
+        """
+        count = 0
+        for category, data in (results.get('data_availability') or {}).items():
+            if category not in CATEGORIES or not data or data.get('status') != 'success':
+                continue
+            items = data.get(CATEGORIES[category]['sample_key'], data.get('sample')) or []
+            count += self.add_items(results['domain'], category, items)
+        return count
+
+    def search(self, query=None, domains=None, categories=None, since=None, until=None, var_id=None, limit=50):
+        """
+        Mencari item berdasarkan kata kunci dan filter
+
+        Args:
+            query (str): Kata kunci; semua kata harus ada di judul/subjek (optional)
+            domains (list): Hanya domain ini (optional)
+            categories (list): Hanya kategori ini (optional)
+            since (str): Tanggal minimal item 'YYYY-MM-DD' (optional)
+            until (str): Tanggal maksimal item 'YYYY-MM-DD' (optional)
+            var_id (str): Hanya item dengan var_id ini (optional)
+            limit (int): Jumlah maksimal hasil (None: semua)
+
+        Returns:
+            list: Item yang cocok (domain, domain_name, category, item_id,
+                title, subject, date, var_id), yang paling relevan lebih dulu
+        """
+        tokens = re.findall(r'\w+', query or '')
+        sql = "SELECT items.domain, items.category, items.item_id, items.title, items.subject, items.date, items.var_id FROM items"
+        where, params = [], []
+        order = "items.domain, items.category, items.date DESC"
+        if tokens and self.fts:
+            sql += " JOIN items_fts ON items_fts.rowid = items.id"
+            where.append("items_fts MATCH ?")
+            params.append(' '.join(f'"{token}"' for token in tokens))
+            order = "items_fts.rank"
+        elif tokens:
+            for token in tokens:
+                where.append("(items.title LIKE ? OR items.subject LIKE ?)")
+                params.extend([f"%{token}%"] * 2)
+
+        for column, values in (('domain', domains), ('category', categories)):
+            if values:
+                where.append(f"items.{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+        if since:
+            where.append("items.date >= ?")
+            params.append(since)
+        if until:
+            where.append("items.date <= ?")
+            params.append(until)
+        if var_id is not None:
+            where.append("items.var_id = ?")
+            params.append(str(var_id))
+
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [
+            {
+                'domain': domain, 'domain_name': DOMAIN_NAMES.get(domain, domain), 'category': category,
+                'item_id': item_id, 'title': title, 'subject': subject, 'date': date, 'var_id': row_var_id,
+            }
+            for domain, category, item_id, title, subject, date, row_var_id in rows
+        ]
+
+    def search_variable(self, var_id, title=None, catalog_path=VARIABLES_CSV, limit=50, **filters):
+        """
+        Mencari item yang cocok dengan satu variabel katalog: var_id sama
+        atau judulnya memuat semua kata judul variabel
+
+        Args:
+            var_id (str): ID variabel
+            title (str): Judul variabel (default: dari katalog CSV)
+            catalog_path (str): Lokasi CSV katalog variabel
+            limit (int): Jumlah maksimal hasil (None: semua)
+            **filters: Filter search (domains, categories, since, until)
+
+        Returns:
+            list: Item yang cocok, format sama dengan search
+        """
+        if title is None:
+            title = next((item['title'] for item in load_variable_catalog(catalog_path)
+                          if item['var_id'] == str(var_id)), '')
+        hits = {(hit['domain'], hit['category'], hit['item_id']): hit
+                for hit in self.search(var_id=var_id, limit=limit, **filters)}
+        if title:
+            for hit in self.search(title, limit=limit, **filters):
+                hits.setdefault((hit['domain'], hit['category'], hit['item_id']), hit)
+        return list(hits.values())[:limit]
+
+    def match_variables(self, var_ids=None, catalog_path=VARIABLES_CSV, **filters):
+        """
+        Mencocokkan variabel di katalog bps_variables.csv dengan item terindeks
+
+        Args:
+            var_ids (list): Hanya variabel ini (default: seluruh katalog)
+            catalog_path (str): Lokasi CSV katalog variabel
+            **filters: Filter search (domains, categories, since, until)
+
+        Returns:
+            dict: {var_id: {'title', 'matches', 'domains'}}
+        """
+        catalog = {}
+        for item in load_variable_catalog(catalog_path):
+            # Beberapa var_id muncul lebih dari sekali di katalog, pakai judul pertama
+            catalog.setdefault(item['var_id'], item['title'])
+        if var_ids is not None:
+            catalog = {str(var_id): catalog.get(str(var_id), '') for var_id in var_ids}
+
+        matches = {}
+        for var_id, title in catalog.items():
+            hits = self.search_variable(var_id, title=title, limit=None, **filters)
+            matches[var_id] = {
+                'title': title,
+                'matches': len(hits),
+                'domains': sorted({hit['domain'] for hit in hits}),
+            }
+        return matches
+
+    def close(self):
+        """
+        Menutup koneksi SQLite
+        """
+        with self.lock:
+            self.conn.close()
+
+
+class ParquetSink:
+    """
+    Menyimpan hasil pengecekan sebagai baris ternormalisasi (satu baris per
+    item sample, atau satu baris per kategori jika tidak ada item) ke dataset
+    Parquet berpartisi Hive, untuk analisis ketersediaan data dari waktu ke waktu.
+    Membutuhkan package 'pyarrow'.
+    """
+
+    def __init__(self, path='bps_dataset', partition_cols=('run_date', 'domain'), batch_rows=50000):
+        """
+        Args:
+            path (str): Direktori dataset Parquet
+            partition_cols (tuple): Kolom partisi (subset dari PARQUET_PARTITIONS)
+            batch_rows (int): Jumlah baris yang ditampung sebelum ditulis ke file
+        """
+        for column in partition_cols:
+            if column not in PARQUET_PARTITIONS:
+                raise ValueError(f"Kolom partisi harus salah satu dari {PARQUET_PARTITIONS}")
+        self.pa, self.ds = _import_pyarrow()
+        self.path = path
+        self.partition_cols = tuple(partition_cols)
+        self.batch_rows = batch_rows
+        self.lock = threading.Lock()
+        self.rows = []
+        self.files_written = 0
+        # Nama file unik per proses agar beberapa run bisa menulis ke dataset yang sama
+        self.prefix = f"part-{datetime.now().strftime('%Y%m%d%H%M%S')}-{os.getpid()}"
+
+    def add_results(self, results):
+        """
+        Menambahkan hasil pengecekan satu domain
+
+        Args:
+            results (dict): Hasil check_all_data_availability, check_domains
+                atau check_changes
+
+        Returns:
+            int: Jumlah baris yang ditambahkan
+        """
+        rows = list(availability_rows(results))
+        with self.lock:
+            self.rows.extend(rows)
+            if len(self.rows) >= self.batch_rows:
+                self._write()
+        return len(rows)
+
+    def flush(self):
+        """
+        Menulis semua baris yang masih ditampung
+        """
+        with self.lock:
+            self._write()
+
+    def close(self):
+        """
+        Menulis sisa baris (sink tetap bisa dipakai lagi setelahnya)
+        """
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _write(self):
+        """
+        Menulis baris yang ditampung sebagai satu batch file. Dipanggil
+        dengan lock sudah dipegang.
+        """
+        if not self.rows:
+            return
+        table = self.pa.Table.from_pylist(self.rows, schema=_parquet_schema(self.pa))
+        self.ds.write_dataset(
+            table, self.path, format='parquet',
+            partitioning=self.ds.partitioning(
+                self.pa.schema([(column, self.pa.string()) for column in self.partition_cols]), flavor='hive'
+            ),
+            basename_template=f"{self.prefix}-{self.files_written}-{{i}}.parquet",
+            existing_data_behavior='overwrite_or_ignore',
+        )
+        self.files_written += 1
+        self.rows = []
+
+
+def _json_default(value):
+    """
+    Konversi tipe numpy/pandas (mis. int64, Timestamp) saat serialisasi JSON
+    """
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class BPSDataChecker:
+    """
+    Kelas untuk mengecek ketersediaan data BPS di berbagai kategori
+    """
+
+    def __init__(self, api_key, domain="7500", timeout=(5, 30), max_retries=3,
+                 backoff_factor=0.5, pool_size=16, all_pages=False, page_workers=4, cache=None,
+                 result_level='samples', use_stadata=False, journal=None, rate_limiter=None,
+                 concurrency=None, categories=None, request_hooks=None, index=None, coalescer=None,
+                 scheduler=None, priority='interactive', archive=None, max_backoff=60):
+        """
+        Inisialisasi dengan API key dan domain BPS
+
+        Args:
+            api_key (str): API key dari WebAPI BPS
+            domain (str): Domain ID BPS (default: "7500" untuk Gorontalo)
+            timeout (tuple): Timeout (connect, read) dalam detik untuk WebAPI
+            max_retries (int): Jumlah percobaan ulang untuk status 429/5xx
+                dan error koneksi
+            backoff_factor (float): Jeda dasar exponential backoff dalam detik
+            max_backoff (float): Jeda maksimal sebelum retry dalam detik, juga
+                untuk header Retry-After dari server (default: 60)
+            pool_size (int): Jumlah maksimal koneksi keep-alive ke WebAPI
+            all_pages (bool): Ambil semua halaman list WebAPI. Jika False,
+                hanya halaman pertama yang diambil dan jumlah total dibaca
+                dari metadata pagination
+            page_workers (int): Jumlah maksimal halaman yang diambil bersamaan
+            cache (ResponseCache): Cache response di disk (optional)
+            result_level (str): Level detail hasil: 'summary', 'samples' atau 'full'
+            use_stadata (bool): Cek static/dynamic tables lewat DataFrame stadata
+                (default: False, langsung lewat pagination WebAPI)
+            journal (CheckpointJournal): Journal checkpoint untuk resume (optional)
+            rate_limiter (RateLimiter): Batas request per detik, mis.
+                shared_rate_limiter() untuk kuota bersama satu proses (optional)
+            concurrency (AdaptiveConcurrency): Pengendali AIMD jumlah request
+                bersamaan; bersama scheduler, batasnya dipakai sebagai
+                max_in_flight scheduler (optional)
+            categories (list): Nama kategori di CATEGORIES yang dicek
+                (default: semua kategori dengan default=True)
+            request_hooks (list): Callable yang dipanggil dengan dict timing
+                setiap request WebAPI/stadata, mis. RequestMetrics() (optional)
+            index (CatalogIndex): Indeks pencarian yang diisi dengan setiap
+                item yang diambil (optional)
+            coalescer (RequestCoalescer): Single-flight dan LRU memori untuk
+                request identik, mis. shared_coalescer() (optional)
+            scheduler (RequestScheduler): Antrian prioritas request bersama,
+                mis. shared_scheduler(); token rate_limiter diambil saat
+                giliran request tiba (optional)
+            priority (str): Kelas prioritas request checker ini di scheduler:
+                'interactive' atau 'bulk' (default: 'interactive')
+            archive (ResponseArchive): Arsip response WebAPI; mode record
+                menyimpan setiap response, mode replay menjalankan pengecekan
+                dari arsip tanpa akses jaringan (optional)
+        """
+        if result_level not in RESULT_LEVELS:
+            raise ValueError(f"result_level harus salah satu dari {RESULT_LEVELS}")
+        for category_name in categories or []:
+            if category_name not in CATEGORIES:
+                raise ValueError(f"Kategori tidak dikenal: {category_name}")
+        if priority not in PRIORITY_CLASSES:
+            raise ValueError(f"priority harus salah satu dari {PRIORITY_CLASSES}")
+
+        self.api_key = api_key
+        self.domain = domain
+        self.base_url = "https://webapi.bps.go.id/v1/api"
+        # Dibagi dengan checker dari for_domain; diisi saat client pertama dipakai
+        self._clients = {}
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+        self.scheduler = scheduler
+        if scheduler is not None and concurrency is not None:
+            scheduler.set_max_in_flight(int(concurrency.limit))
+        self.priority = priority
+        # Batas waktu (time.monotonic()) semua request checker ini, diisi with_priority
+        self.deadline = None
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.all_pages = all_pages
+        self.page_workers = page_workers
+        self.cache = cache
+        self.archive = archive
+        self.index = index
+        self.coalescer = coalescer
+        self.result_level = result_level
+        self.use_stadata = use_stadata
+        self.journal = journal
+        self.categories = list(categories) if categories is not None else None
+        self.request_hooks = list(request_hooks or [])
+
+        # Session dipakai bersama (termasuk oleh for_domain) agar koneksi
+        # TCP/TLS ke webapi.bps.go.id tidak dibuka ulang di setiap request
+        import requests
+        self.session = requests.Session()
+        adapter = _timed_adapter_class()(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    @property
+    def client(self):
+        """
+        stadata.Client, dibuat (dan stadata/pandas diimport) saat pertama
+        dipakai oleh jalur use_stadata
+        """
+        if 'stadata' not in self._clients:
+            self._clients.setdefault('stadata', _import_stadata().Client(self.api_key))
+        return self._clients['stadata']
+
+    def _now(self):
+        """
+        Waktu pengecekan: waktu run arsip saat replay (agar laporan yang
+        dihitung ulang tetap bertanggal run aslinya), selain itu waktu sekarang
+        """
+        if self.archive is not None and self.archive.replaying:
+            return self.archive.started_at
+        return datetime.now()
+
+    @property
+    def domain_name(self):
+        """
+        Nama domain BPS (kode domain jika namanya tidak diketahui)
+        """
+        return DOMAIN_NAMES.get(self.domain, self.domain)
+
+    def for_domain(self, domain):
+        """
+        Membuat checker untuk domain lain dengan API key, client dan
+        rate limiter yang sama
+
+        Args:
+            domain (str): Domain ID BPS
+
+        Returns:
+            BPSDataChecker: Checker baru untuk domain tersebut
+        """
+        checker = BPSDataChecker.__new__(BPSDataChecker)
+        checker.__dict__.update(self.__dict__)
+        checker.domain = domain
+        # Hook baru di satu checker tidak ikut mencatat request checker lain
+        checker.request_hooks = list(self.request_hooks)
+        return checker
+
+    def with_priority(self, priority, timeout=None):
+        """
+        Membuat checker dengan kelas prioritas scheduler (dan deadline) lain,
+        mis. pengecekan yang diminta pengguna di tengah crawl bulk
+
+        Args:
+            priority (str): Kelas prioritas: 'interactive' atau 'bulk'
+            timeout (float): Batas waktu semua request checker baru dalam
+                detik sejak sekarang; request yang belum selesai saat itu
+                gagal dengan TimeoutError (optional)
+
+        Returns:
+            BPSDataChecker: Checker baru untuk domain yang sama
+        """
+        if priority not in PRIORITY_CLASSES:
+            raise ValueError(f"priority harus salah satu dari {PRIORITY_CLASSES}")
+        checker = self.for_domain(self.domain)
+        checker.priority = priority
+        checker.deadline = time.monotonic() + timeout if timeout is not None else None
+        return checker
+
+    def fetch_domain_list(self, domain_type='all'):
+        """
+        Mengambil daftar domain BPS dari WebAPI
+
+        Args:
+            domain_type (str): Jenis domain: 'all', 'prov', 'kab' atau 'kabbyprov'
+
+        Returns:
+            list: Daftar dict domain (domain_id, domain_name, domain_url)
+        """
+        url = f"{self.base_url}/domain/type/{domain_type}/key/{self.api_key}"
+        if domain_type == 'kabbyprov':
+            url = f"{url}/prov/{self.domain}"
+        data = self._get_json(url, 'domain')
+        if 'data' in data and len(data['data']) > 1:
+            return data['data'][1]
+        return []
+
+    def _backoff_delay(self, attempt, response=None):
+        """
+        Menghitung jeda sebelum percobaan ulang (exponential backoff dengan
+        full jitter, atau header Retry-After jika dikirim server), paling
+        lama max_backoff detik
+
+        Args:
+            attempt (int): Nomor percobaan, dimulai dari 0
+            response (requests.Response): Response yang gagal (optional)
+
+        Returns:
+            float: Jeda dalam detik
+        """
+        if response is not None:
+            retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        return min(random.uniform(0, self.backoff_factor * (2 ** attempt)), self.max_backoff)
+
+    def _request(self, url, headers=None):
+        """
+        GET ke WebAPI BPS lewat session bersama, dengan timeout, rate limit
+        dan retry untuk status 429/5xx maupun error koneksi
+
+        Args:
+            url (str): URL endpoint WebAPI
+            headers (dict): Header tambahan, mis. untuk request bersyarat
+
+        Returns:
+            requests.Response: Response yang berhasil (status 2xx atau 304)
+        """
+        import requests
+        timing = getattr(_timing_context, 'current', None)
+        for attempt in range(self.max_retries + 1):
+            timeout = self._acquire_slot()
+            if timing is not None:
+                timing['attempts'] = attempt + 1
+
+            start = time.monotonic()
+            try:
+                response = self.session.get(url, headers=headers, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                self._release_slot(time.monotonic() - start, error=True)
+                if attempt == self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                if not self._has_time_for(delay):
+                    raise
+                _log_event(logging.DEBUG, 'request_retry', "[RETRY] %s gagal terhubung, coba lagi dalam %.1f detik",
+                           self._endpoint_name(url), delay, domain=self.domain, url=url, attempt=attempt + 1)
+                time.sleep(delay)
+                continue
+            except Exception:
+                self._release_slot(time.monotonic() - start, error=True)
+                raise
+
+            self._release_slot(time.monotonic() - start, response.status_code)
+            if timing is not None:
+                timing['status'] = response.status_code
+                timing['ttfb_ms'] = response.elapsed.total_seconds() * 1000
+                timing['bytes'] = len(response.content)
+
+            if response.status_code in RETRY_STATUS_CODES and attempt < self.max_retries:
+                delay = self._backoff_delay(attempt, response)
+                if not self._has_time_for(delay):
+                    # Jeda retry melewati deadline: gagal sekarang daripada menunggu sia-sia
+                    response.raise_for_status()
+                if response.headers.get('Retry-After') and self.rate_limiter is not None:
+                    # Tahan semua checker yang memakai limiter ini, bukan hanya thread ini
+                    self.rate_limiter.pause(delay)
+                response.close()
+                _log_event(logging.DEBUG, 'request_retry', "[RETRY] %s status %d, coba lagi dalam %.1f detik",
+                           self._endpoint_name(url), response.status_code, delay,
+                           domain=self.domain, url=url, attempt=attempt + 1, status=response.status_code)
+                time.sleep(delay)
+                continue
+
+            response.raise_for_status()
+            return response
+
+    def _acquire_slot(self):
+        """
+        Menunggu giliran satu request: antrian scheduler, atau rate limiter
+        dan batas AIMD jika tanpa scheduler. Dengan scheduler, batas AIMD
+        menjadi max_in_flight scheduler (lihat _release_slot) agar urutan
+        prioritas tidak hilang di antrian kedua.
+
+        Returns:
+            tuple: Timeout request, dipotong sisa waktu sampai deadline
+
+        Raises:
+            TimeoutError: Jika deadline terlewati sebelum request dikirim
+        """
+        if self.scheduler is not None:
+            self.scheduler.acquire(self.priority, self.domain, self.deadline, self.rate_limiter)
+        elif self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        timeout = self.timeout
+        if self.deadline is not None:
+            try:
+                remaining = self._remaining()
+            except TimeoutError:
+                if self.scheduler is not None:
+                    self.scheduler.release()
+                raise
+            if isinstance(timeout, tuple):
+                timeout = tuple(min(value, remaining) for value in timeout)
+            else:
+                timeout = min(timeout, remaining)
+
+        if self.concurrency is not None and self.scheduler is None:
+            self.concurrency.acquire()
+        return timeout
+
+    def _release_slot(self, latency, status_code=None, error=False):
+        """
+        Mengembalikan giliran request ke pengendali AIMD dan scheduler
+        """
+        if self.scheduler is not None:
+            if self.concurrency is not None:
+                self.scheduler.set_max_in_flight(self.concurrency.observe(latency, status_code, error=error))
+            self.scheduler.release()
+        elif self.concurrency is not None:
+            self.concurrency.release(latency, status_code, error=error)
+
+    def _remaining(self):
+        """
+        Sisa waktu sampai deadline dalam detik (None jika tanpa deadline)
+
+        Raises:
+            TimeoutError: Jika deadline sudah terlewati
+        """
+        if self.deadline is None:
+            return None
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Deadline terlewati sebelum request domain {self.domain} dikirim")
+        return remaining
+
+    def _has_time_for(self, delay):
+        """
+        True jika jeda retry sebesar delay detik masih selesai sebelum deadline
+        """
+        return self.deadline is None or time.monotonic() + delay < self.deadline
+
+    def _cache_key(self, url):
+        """
+        Kunci cache dari URL WebAPI (endpoint, domain, halaman, parameter)
+        tanpa API key
+        """
+        return url.replace(f"/key/{self.api_key}", "")
+
+    def _archive_key(self, url):
+        """
+        Kunci arsip dari URL WebAPI: seperti kunci cache tetapi relatif
+        terhadap base_url, agar arsip dapat di-replay dari host API lain
+        """
+        key = self._cache_key(url)
+        return key[len(self.base_url):] if key.startswith(self.base_url) else key
+
+    def _get_json(self, url, category):
+        """
+        GET JSON dari WebAPI melalui cache (jika ada). Entry yang masih
+        dalam TTL langsung dipakai; entry kedaluwarsa direvalidasi dengan
+        If-None-Match/If-Modified-Since bila server mengirim ETag/Last-Modified.
+        Dengan coalescer, request identik yang berjalan bersamaan hanya
+        dikirim sekali dan hasilnya disimpan sebentar di memori.
+
+        Args:
+            url (str): URL endpoint WebAPI
+            category (str): Kategori/model untuk TTL cache
+
+        Returns:
+            dict: Response JSON
+        """
+        timing = {}
+        # Timing koneksi/response hanya diukur bila ada request_hooks
+        _timing_context.current = timing if self.request_hooks else None
+        start = time.perf_counter()
+        try:
+            data = self._fetch_json(url, category, timing)
+        except Exception:
+            self._record_request(self._endpoint_name(url), start, timing, error=True)
+            raise
+        finally:
+            _timing_context.current = None
+        self._record_request(self._endpoint_name(url), start, timing)
+        return data
+
+    def _fetch_json(self, url, category, timing):
+        """
+        Isi _get_json: ambil dari arsip replay, coalescer, cache atau WebAPI,
+        catat status cache ('replay', 'memory', 'coalesced', 'hit',
+        'revalidated', 'miss') ke timing dan rekam response ke arsip.
+        Arsip ditangani di luar coalescer: data replay tidak masuk ke memori
+        bersama checker live, dan hasil dari memori/request pemanggil lain
+        tetap direkam.
+        """
+        if self.archive is not None and self.archive.replaying:
+            timing['cache'] = 'replay'
+            return json.loads(self.archive.load(self._archive_key(url)))
+
+        if self.coalescer is None:
+            data, response = self._fetch_json_live(url, category, timing)
+        else:
+            loaded = {}
+
+            def load():
+                loaded['data'], loaded['response'] = self._fetch_json_live(url, category, timing)
+                return loaded['data']
+
+            data, source = self.coalescer.get(url, load, timeout=self._remaining())
+            if source is not None:
+                timing['cache'] = source
+            response = loaded.get('response')
+
+        if self.archive is not None:
+            if response is not None:
+                body = response.content
+            else:
+                # Dari cache/coalescer: body mentah tidak ada, simpan JSON yang setara
+                body = json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=_json_default).encode('utf-8')
+            self.archive.record(self._archive_key(url), body)
+        return data
+
+    def _fetch_json_live(self, url, category, timing):
+        """
+        Ambil JSON dari cache atau WebAPI
+
+        Returns:
+            tuple: (data, response WebAPI atau None jika dari cache)
+        """
+        if self.cache is None:
+            response = self._request(url)
+            return response.json(), response
+
+        key = self._cache_key(url)
+        entry = self.cache.get(key, category)
+        if entry is not None and entry['fresh']:
+            timing['cache'] = 'hit'
+            return entry['value'], None
+
+        headers = {}
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = self._request(url, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            timing['cache'] = 'revalidated'
+            self.cache.touch(key)
+            return entry['value'], None
+
+        timing['cache'] = 'miss'
+        data = response.json()
+        self.cache.put(key, category, data, etag=response.headers.get('ETag'),
+                       last_modified=response.headers.get('Last-Modified'))
+        return data, response
+
+    def _cached_call(self, key, category, loader):
+        """
+        Menjalankan loader (mis. pemanggilan stadata) melalui cache
+
+        Args:
+            key (str): Kunci cache
+            category (str): Kategori untuk TTL cache
+            loader (callable): Fungsi tanpa argumen yang menghasilkan data
+
+        Returns:
+            Data dari cache atau hasil loader
+        """
+        timing = {}
+        start = time.perf_counter()
+        try:
+            if self.archive is not None and self.archive.replaying:
+                timing['cache'] = 'replay'
+                return json.loads(self.archive.load(key))
+
+            if self.cache is not None:
+                entry = self.cache.get(key, category)
+                if entry is not None and entry['fresh']:
+                    timing['cache'] = 'hit'
+                    value = entry['value']
+                else:
+                    timing['cache'] = 'miss'
+                    value = loader()
+                    self.cache.put(key, category, value)
+            else:
+                value = loader()
+
+            if self.archive is not None:
+                self.archive.record(key, json.dumps(value, ensure_ascii=False, separators=(',', ':'),
+                                                    default=_json_default).encode('utf-8'))
+            return value
+        except Exception:
+            timing['error'] = True
+            raise
+        finally:
+            self._record_request(f"stadata/{category}", start, timing, error=timing.get('error', False))
+
+    def _endpoint_name(self, url):
+        """
+        Nama endpoint untuk metrik, mis. 'list/model/publication'
+        """
+        parts = url[len(self.base_url):].strip('/').split('/')
+        if parts[:2] == ['list', 'model']:
+            return '/'.join(parts[:3])
+        return parts[0]
+
+    def _record_request(self, endpoint, start, timing, error=False):
+        """
+        Mengirim timing satu request ke semua request_hooks
+        """
+        if not self.request_hooks:
+            return
+        entry = {
+            'endpoint': endpoint,
+            'domain': self.domain,
+            'status': timing.get('status'),
+            'error': error,
+            'bytes': timing.get('bytes', 0),
+            'dns_ms': round(timing.get('dns_ms', 0.0), 3),
+            'connect_ms': round(timing.get('connect_ms', 0.0), 3),
+            'ttfb_ms': round(timing.get('ttfb_ms', 0.0), 3),
+            'total_ms': round((time.perf_counter() - start) * 1000, 3),
+            'cache': timing.get('cache'),
+            'attempts': timing.get('attempts', 0),
+            'timestamp': time.time(),
+        }
+        for hook in tuple(self.request_hooks):
+            hook(entry)
+
+    def _fetch_page(self, model, page=1):
+        """
+        Mengambil satu halaman list/model dari WebAPI
+
+        Args:
+            model (str): Nama model WebAPI (mis. 'publication')
+            page (int): Nomor halaman, dimulai dari 1
+
+        Returns:
+            dict: Response JSON halaman tersebut
+        """
+        if self.journal is not None and self.all_pages:
+            data = self.journal.get_page(self.domain, model, page)
+            if data is not None:
+                return data
+
+        url = f"{self.base_url}/list/model/{model}/domain/{self.domain}/key/{self.api_key}/page/{page}"
+        data = self._get_json(url, model)
+
+        if self.journal is not None and self.all_pages:
+            self.journal.record_page(self.domain, model, page, data)
+        return data
+
+    @staticmethod
+    def _parse_list_page(data):
+        """
+        Memisahkan metadata pagination dan daftar item dari response list
+
+        Args:
+            data (dict): Response JSON list/model
+
+        Returns:
+            tuple: (metadata pagination, daftar item)
+        """
+        # Data biasanya ada di index 1 dari array data, metadata di index 0
+        if isinstance(data.get('data'), list) and len(data['data']) > 1:
+            return data['data'][0] or {}, data['data'][1] or []
+        return {}, []
+
+    def _fetch_list(self, model, all_pages=None, limit=None):
+        """
+        Mengambil list/model dari WebAPI beserta jumlah totalnya. Halaman
+        pertama selalu diambil; jika all_pages aktif, sisa halaman diambil
+        bersamaan sesuai jumlah 'pages' di metadata. Tanpa all_pages, halaman
+        berikutnya hanya diambil bila dibutuhkan untuk mencapai limit item.
+
+        Args:
+            model (str): Nama model WebAPI (mis. 'publication')
+            all_pages (bool): Override self.all_pages (optional)
+            limit (int): Jumlah item yang dibutuhkan saat all_pages tidak aktif
+
+        Returns:
+            tuple: (daftar item, jumlah total dari metadata, response halaman pertama)
+        """
+        if all_pages is None:
+            all_pages = self.all_pages
+
+        data = self._fetch_page(model, 1)
+        meta, items = self._parse_list_page(data)
+        items = list(items)
+
+        pages = int(meta.get('pages') or 1)
+        if not all_pages and limit and items and limit > len(items):
+            # Hanya ambil halaman secukupnya untuk sample sebanyak limit
+            pages = min(pages, -(-limit // len(items)))
+            all_pages = True
+        if all_pages and pages > 1:
+            workers = max(1, min(self.page_workers, pages - 1))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for page_data in executor.map(lambda page: self._fetch_page(model, page), range(2, pages + 1)):
+                    items.extend(self._parse_list_page(page_data)[1])
+
+        total_count = int(meta.get('total', len(items)))
+        return items, total_count, data
+
+    @staticmethod
+    def _summarize_dataframe(data, limit):
+        """
+        Meringkas DataFrame stadata menjadi jumlah baris dan sample records
+
+        Args:
+            data (pd.DataFrame): Hasil list_statictable/list_dynamictable
+            limit (int): Jumlah maksimal sample
+
+        Returns:
+            dict: {'total': jumlah baris, 'records': sample records}
+        """
+        # Perbaiki pengecekan DataFrame
+        if data is None or data.empty:
+            return {'total': 0, 'records': []}
+        return {'total': len(data), 'records': data.head(limit).to_dict('records')}
+
+    def _apply_result_level(self, result, sample_key, id_field, api_response=None):
+        """
+        Menyesuaikan hasil satu kategori dengan self.result_level
+
+        Args:
+            result (dict): Hasil kategori dengan item sample di sample_key
+            sample_key (str): Nama field sample, mis. 'sample_publications'
+            id_field (str): Field ID item, mis. 'pub_id'
+            api_response (dict): Response mentah WebAPI (hanya untuk level 'full')
+
+        Returns:
+            dict: Hasil yang sudah disesuaikan
+        """
+        if self.result_level == 'full' and api_response is not None:
+            result['api_response'] = api_response
+        elif self.result_level == 'summary':
+            items = result.pop(sample_key)
+            result['sample_ids'] = [_item_key(item, id_field) for item in items]
+            result['sample_hashes'] = [_item_hash(item) for item in items]
+        return result
+
+    def check_category(self, category_name, limit=10):
+        """
+        Mengecek ketersediaan satu kategori berdasarkan spec di CATEGORIES
+
+        Args:
+            category_name (str): Nama kategori, mis. 'publications'
+            limit (int): Jumlah maksimal data yang ditampilkan
+
+        Returns:
+            dict: Informasi ketersediaan kategori
+        """
+        spec = CATEGORIES[category_name]
+        try:
+            _log_event(logging.DEBUG, 'category_start', "[CHECKING] Mengecek %s untuk domain %s...",
+                       spec['label'], self.domain, domain=self.domain, category=category_name)
+
+            data = None
+            if self.use_stadata and spec.get('stadata'):
+                # Menggunakan stadata library (membangun DataFrame seluruh daftar tabel)
+                stadata_method = getattr(self.client, spec['stadata'])
+                summary = self._cached_call(
+                    f"stadata/{spec['model']}/domain/{self.domain}/limit/{limit}", spec['model'],
+                    lambda: self._summarize_dataframe(stadata_method(all=False, domain=[self.domain]), limit)
+                )
+                total_count = summary['total']
+                items = summary['records']
+            else:
+                # Jumlah dari metadata pagination, hanya sample yang diambil
+                items, total_count, data = self._fetch_list(spec['model'], limit=limit)
+
+            if self.index is not None:
+                self.index.add_items(self.domain, category_name, items, replace=len(items) >= total_count)
+
+            result = {
+                'status': 'success',
+                spec['count_key']: total_count,
+                spec['sample_key']: items[:limit],
+                'last_checked': self._now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+            result = self._apply_result_level(result, spec['sample_key'], spec['id_field'], data)
+
+            _log_event(logging.DEBUG, 'category_found', "[SUCCESS] Ditemukan %s %s", total_count, spec['label'],
+                       domain=self.domain, category=category_name, total=total_count)
+            return result
+
+        except Exception as e:
+            _log_event(logging.ERROR, 'category_error', "[ERROR] Error checking %s: %s", spec['label'].lower(), e,
+                       domain=self.domain, category=category_name, error=str(e))
+            return {
+                'status': 'error',
+                'error': str(e),
+                'last_checked': self._now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+
+    def check_static_tables(self, limit=10):
+        """
+        Mengecek ketersediaan Static Tables
+
+        Args:
+            limit (int): Jumlah maksimal data yang ditampilkan
+
+        Returns:
+            dict: Informasi ketersediaan static tables
+        """
+        return self.check_category('static_tables', limit=limit)
+
+    def check_dynamic_tables(self, limit=10):
+        """
+        Mengecek ketersediaan Dynamic Tables (Data)
+
+        Args:
+            limit (int): Jumlah maksimal data yang ditampilkan
+
+        Returns:
+            dict: Informasi ketersediaan dynamic tables
+        """
+        return self.check_category('dynamic_tables', limit=limit)
+
+    def check_publications(self, limit=10):
+        """
+        Mengecek ketersediaan Publications
+
+        Args:
+            limit (int): Jumlah maksimal data yang ditampilkan
+
+        Returns:
+            dict: Informasi ketersediaan publications
+        """
+        return self.check_category('publications', limit=limit)
+
+    def check_press_releases(self, limit=10):
+        """
+        Mengecek ketersediaan Press Releases
+
+        Args:
+            limit (int): Jumlah maksimal data yang ditampilkan
+
+        Returns:
+            dict: Informasi ketersediaan press releases
+        """
+        return self.check_category('press_releases', limit=limit)
+
+    def check_strategic_indicators(self, limit=10):
+        """
+        Mengecek ketersediaan Strategic Indicators
+
+        Args:
+            limit (int): Jumlah maksimal data yang ditampilkan
+
+        Returns:
+            dict: Informasi ketersediaan strategic indicators
+        """
+        return self.check_category('strategic_indicators', limit=limit)
+
+    def check_news(self, limit=10):
+        """
+        Mengecek ketersediaan News/Berita BPS
+
+        Args:
+            limit (int): Jumlah maksimal data yang ditampilkan
+
+        Returns:
+            dict: Informasi ketersediaan news
+        """
+        return self.check_category('news', limit=limit)
+
+    def check_infographics(self, limit=10):
+        """
+        Mengecek ketersediaan Infographics
+
+        Args:
+            limit (int): Jumlah maksimal data yang ditampilkan
+
+        Returns:
+            dict: Informasi ketersediaan infographics
+        """
+        return self.check_category('infographics', limit=limit)
+
+    def check_subjects(self, limit=10):
+        """
+        Mengecek ketersediaan Subjects
+
+        Args:
+            limit (int): Jumlah maksimal data yang ditampilkan
+
+        Returns:
+            dict: Informasi ketersediaan subjects
+        """
+        return self.check_category('subjects', limit=limit)
+
+    def get_check_functions(self):
+        """
+        Daftar kategori dan fungsi checking yang dijalankan oleh
+        check_all_data_availability
+
+        Returns:
+            list: Pasangan (nama_kategori, fungsi_checking) sesuai urutan output
+        """
+        if self.categories is not None:
+            names = self.categories
+        else:
+            names = [name for name, spec in CATEGORIES.items() if spec.get('default', True)]
+        return [(name, functools.partial(self.check_category, name)) for name in names]
+
+    def _run_check(self, category_name, check_function, limit):
+        """
+        Menjalankan satu fungsi checking dengan isolasi error per kategori
+
+        Args:
+            category_name (str): Nama kategori
+            check_function (callable): Fungsi checking kategori
+            limit (int): Jumlah maksimal sample
+
+        Returns:
+            dict: Hasil pengecekan kategori (status error jika gagal)
+        """
+        if self.journal is not None:
+            result = self.journal.get_result(self.domain, category_name)
+            if result is not None:
+                _log_event(logging.INFO, 'category_resumed', "[RESUME] %s domain %s sudah selesai, dilewati",
+                           category_name.replace('_', ' ').title(), self.domain,
+                           domain=self.domain, category=category_name)
+                return result
+
+        try:
+            result = check_function(limit=limit)
+            _log_event(logging.INFO, 'category_checked', "[DATA] %s: %s", category_name.replace('_', ' ').title(),
+                       '[SUCCESS] Available' if result['status'] == 'success' else '[ERROR] Error',
+                       domain=self.domain, category=category_name, status=result['status'])
+            # Hanya kategori yang berhasil dicatat, kategori error diulang saat resume
+            if self.journal is not None and result['status'] == 'success':
+                self.journal.record_result(self.domain, category_name, result)
+            return result
+        except Exception as e:
+            _log_event(logging.ERROR, 'category_checked', "[DATA] %s: [ERROR] Error - %s",
+                       category_name.replace('_', ' ').title(), e,
+                       domain=self.domain, category=category_name, status='error', error=str(e))
+            return {
+                'status': 'error',
+                'error': str(e),
+                'last_checked': self._now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+
+    def _new_results(self):
+        """
+        Membuat kerangka hasil pengecekan untuk domain checker ini
+
+        Returns:
+            dict: Header hasil dengan data_availability kosong
+        """
+        return {
+            'domain': self.domain,
+            'domain_name': self.domain_name,
+            'check_timestamp': self._now().strftime('%Y-%m-%d %H:%M:%S'),
             'data_availability': {}
         }
 
-        # Daftar fungsi checking yang akan dijalankan
-        check_functions = [
-            ('static_tables', self.check_static_tables),
-            ('dynamic_tables', self.check_dynamic_tables),
-            ('subjects', self.check_subjects),
-            ('publications', self.check_publications),
-            ('press_releases', self.check_press_releases),
-            ('strategic_indicators', self.check_strategic_indicators),
-            ('news', self.check_news),
-            ('infographics', self.check_infographics)
-        ]
+    def check_all_data_availability(self, limit_per_category=5, concurrent=False, max_workers=None):
+        """
+        Mengecek ketersediaan semua jenis data BPS secara menyeluruh
+
+        Args:
+            limit_per_category (int): Jumlah maksimal sample per kategori
+            concurrent (bool): Jalankan semua kategori secara bersamaan
+                menggunakan thread pool (default: False, berurutan)
+            max_workers (int): Jumlah maksimal thread saat concurrent=True
+                (default: satu thread per kategori)
+
+        Returns:
+            dict: Ringkasan ketersediaan semua data BPS
+        """
+        _log_event(logging.INFO, 'check_start', "[START] Memulai pengecekan ketersediaan data BPS untuk Domain %s (%s)",
+                   self.domain_name, self.domain, domain=self.domain)
+
+        results = self._new_results()
+
+        # Timing dikumpulkan lewat salinan checker agar pemanggil lain pada
+        # checker yang sama tidak ikut tercatat
+        timings = RequestMetrics(domain=self.domain)
+        checker = self.for_domain(self.domain)
+        checker.request_hooks.append(timings)
+
+        # Jalankan semua pengecekan
+        checker._run_all_checks(results, checker.get_check_functions(), limit_per_category, concurrent, max_workers)
+        results['timings'] = timings.summary()
+
+        _log_event(logging.INFO, 'check_done', "[SUCCESS] Pengecekan selesai!", domain=self.domain)
+        return results
+
+    def _run_all_checks(self, results, check_functions, limit_per_category, concurrent, max_workers):
+        """
+        Menjalankan semua fungsi checking (berurutan atau di thread pool) dan
+        mengisi results['data_availability']
+        """
+        if concurrent:
+            workers = max_workers or len(check_functions)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    (category_name, executor.submit(self._run_check, category_name, check_function, limit_per_category))
+                    for category_name, check_function in check_functions
+                ]
+                # Urutan kategori di output tetap sama dengan mode berurutan
+                for category_name, future in futures:
+                    results['data_availability'][category_name] = future.result()
+        else:
+            for category_name, check_function in check_functions:
+                results['data_availability'][category_name] = self._run_check(
+                    category_name, check_function, limit_per_category
+                )
+
+    def _run_record(self, category_name, check_function, limit):
+        """
+        Menjalankan satu kategori dan membungkus hasilnya sebagai record
+        (domain, kategori) untuk iter_availability
+        """
+        result = self._run_check(category_name, check_function, limit)
+        return {'domain': self.domain, 'domain_name': self.domain_name, 'category': category_name, **result}
+
+    def iter_availability(self, domains=None, limit_per_category=5, max_workers=8, requests_per_second=None,
+                          priority='bulk'):
+        """
+        Generator yang mengecek setiap pasangan (domain, kategori) di thread
+        pool dan langsung menghasilkan satu record begitu pasangan itu selesai.
+        Jumlah job yang dijadwalkan sekaligus dibatasi sehingga memori tetap
+        konstan berapa pun jumlah domainnya.
+
+        Args:
+            domains (list): Daftar domain ID BPS (default: domain checker ini)
+            limit_per_category (int): Jumlah maksimal sample per kategori
+            max_workers (int): Jumlah maksimal job yang berjalan bersamaan
+            requests_per_second (float): Batas request per detik pada rate
+                limiter bersama satu proses (default: rate limiter checker ini, jika ada)
+            priority (str): Kelas prioritas request di scheduler (default: 'bulk')
+
+        Yields:
+            dict: Record berisi domain, domain_name, category dan hasil kategori,
+                sesuai urutan selesai
+        """
+        if domains is None:
+            domains = [self.domain]
+        rate_limiter = shared_rate_limiter(requests_per_second) if requests_per_second else self.rate_limiter
+
+        def jobs():
+            for domain in dict.fromkeys(domains):
+                checker = self.for_domain(domain)
+                checker.rate_limiter = rate_limiter
+                checker.priority = priority
+                for category_name, check_function in checker.get_check_functions():
+                    yield checker, category_name, check_function
+
+        pending_jobs = jobs()
+        done = queue.Queue()
+        in_flight = 0
+        exhausted = False
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            while True:
+                while not exhausted and in_flight < max_workers * 2:
+                    job = next(pending_jobs, None)
+                    if job is None:
+                        exhausted = True
+                        break
+                    checker, category_name, check_function = job
+                    future = executor.submit(checker._run_record, category_name, check_function, limit_per_category)
+                    future.add_done_callback(done.put)
+                    in_flight += 1
+
+                if in_flight == 0:
+                    break
+                future = done.get()
+                in_flight -= 1
+                yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def check_domains(self, domains, limit_per_category=5, max_workers=8, requests_per_second=None,
+                      priority='bulk'):
+        """
+        Mengecek ketersediaan data untuk banyak domain sekaligus.
+        Setiap pasangan (domain, kategori) dijadwalkan sebagai satu job di
+        thread pool, dan hasil sebuah domain langsung dikembalikan begitu
+        semua kategorinya selesai.
 
-        # Jalankan semua pengecekan
-        for category_name, check_function in check_functions:
+        Args:
+            domains (list): Daftar domain ID BPS
+            limit_per_category (int): Jumlah maksimal sample per kategori
+            max_workers (int): Jumlah maksimal job yang berjalan bersamaan
+            requests_per_second (float): Batas request per detik pada rate
+                limiter bersama satu proses (default: rate limiter checker ini, jika ada)
+            priority (str): Kelas prioritas request di scheduler (default: 'bulk')
+
+        Yields:
+            dict: Hasil per domain dengan format yang sama seperti
+                check_all_data_availability, sesuai urutan selesai
+        """
+        pending = {}
+        timings = RequestMetrics()
+        # Hook hanya dipasang di salinan checker (dan checker per domain turunannya)
+        scoped = self.for_domain(self.domain)
+        scoped.request_hooks.append(timings)
+        for record in scoped.iter_availability(domains, limit_per_category, max_workers, requests_per_second,
+                                           priority):
+            domain = record.pop('domain')
+            category_name = record.pop('category')
+            record.pop('domain_name')
+
+            if domain not in pending:
+                checker = self.for_domain(domain)
+                results = checker._new_results()
+                # Simpan urutan kategori sesuai mode satu domain
+                for name, _ in checker.get_check_functions():
+                    results['data_availability'][name] = None
+                pending[domain] = results
+
+            results = pending[domain]
+            results['data_availability'][category_name] = record
+            if all(value is not None for value in results['data_availability'].values()):
+                # Entry domain yang sudah selesai dibuang agar memori tetap konstan
+                results['timings'] = timings.summary(domain, clear=True)
+                yield pending.pop(domain)
+
+    def _fetch_items_since(self, model, date_field, since):
+        """
+        Mengambil item list/model halaman demi halaman dan berhenti begitu
+        item terbaru di sebuah halaman lebih lama dari waktu snapshot sebelumnya
+
+        Args:
+            model (str): Nama model WebAPI
+            date_field (str): Field tanggal item (None: ambil semua halaman)
+            since (str): Timestamp snapshot sebelumnya ('%Y-%m-%d %H:%M:%S')
+
+        Returns:
+            tuple: (daftar item, jumlah total dari metadata, jumlah halaman
+                diambil, True jika semua halaman diambil)
+        """
+        meta, page_items = self._parse_list_page(self._fetch_page(model, 1))
+        items = list(page_items)
+        pages = int(meta.get('pages') or 1)
+        total_count = int(meta.get('total', len(items)))
+
+        page = 1
+        while page < pages:
+            if date_field and since and page_items:
+                newest = max(str(item.get(date_field) or '')[:10] for item in page_items)
+                if newest and newest < since[:10]:
+                    break
+            page += 1
+            page_items = self._parse_list_page(self._fetch_page(model, page))[1]
+            items.extend(page_items)
+
+        return items, total_count, page, page >= pages
+
+    def check_changes(self, previous=None, limit_per_category=5):
+        """
+        Mode incremental: membandingkan katalog setiap kategori dengan
+        snapshot sebelumnya dan menghitung item yang ditambah, dihapus atau
+        diubah (berdasarkan ID item dan updt_date/hash isi item)
+
+        Args:
+            previous (dict): Snapshot sebelumnya dari check_changes (optional,
+                default: snapshot terbaru di direktori kerja)
+            limit_per_category (int): Jumlah maksimal sample per kategori
+
+        Returns:
+            dict: Snapshot baru; setiap kategori berisi 'item_index' untuk
+                run berikutnya dan 'changes' berisi delta terhadap snapshot lama
+        """
+        if previous is None:
+            latest = find_latest_snapshot(self.domain)
+            previous = load_results_from_json(latest) if latest else {}
+
+        _log_event(logging.INFO, 'changes_start', "[START] Mengecek perubahan data BPS untuk Domain %s (%s)",
+                   self.domain_name, self.domain, domain=self.domain)
+
+        results = self._new_results()
+        results['incremental'] = True
+        results['previous_check_timestamp'] = previous.get('check_timestamp')
+        since = previous.get('check_timestamp')
+
+        for category_name, _ in self.get_check_functions():
+            spec = CATEGORIES[category_name]
+            model, id_field, date_field = spec['model'], spec['id_field'], spec['date_field']
             try:
-                result = check_function(limit=limit_per_category)
-                results['data_availability'][category_name] = result
-                print(f"[DATA] {category_name.replace('_', ' ').title()}: {'[SUCCESS] Available' if result['status'] == 'success' else '[ERROR] Error'}")
+                _log_event(logging.DEBUG, 'changes_category_start', "[CHECKING] Mengecek perubahan %s untuk domain %s...",
+                           category_name.replace('_', ' ').title(), self.domain,
+                           domain=self.domain, category=category_name)
+                previous_category = previous.get('data_availability', {}).get(category_name) or {}
+                previous_index = previous_category.get('item_index')
+
+                items, total_count, pages_fetched, complete = self._fetch_items_since(
+                    model, date_field, since if previous_index is not None else None
+                )
+                fetched = {_item_key(item, id_field): item for item in items}
+                item_index = {key: _item_version(item, date_field) for key, item in fetched.items()}
+
+                if not complete:
+                    # Halaman lama dianggap tidak berubah; jika jumlah total tidak
+                    # cocok berarti ada item lama yang dihapus, ambil ulang semua
+                    merged = dict(previous_index)
+                    merged.update(item_index)
+                    if len(merged) == total_count:
+                        item_index = merged
+                    else:
+                        items, total_count, pages_fetched, complete = self._fetch_items_since(model, None, None)
+                        fetched = {_item_key(item, id_field): item for item in items}
+                        item_index = {key: _item_version(item, date_field) for key, item in fetched.items()}
+
+                if self.index is not None:
+                    self.index.add_items(self.domain, category_name, items, replace=complete)
+
+                if previous_index is None:
+                    changes = {'baseline': True, 'added': [], 'removed': [], 'modified': []}
+                else:
+                    changes = {
+                        'baseline': False,
+                        'added': [fetched[key] for key in fetched if key not in previous_index],
+                        'removed': [key for key in previous_index if key not in item_index],
+                        'modified': [fetched[key] for key in fetched
+                                     if key in previous_index and previous_index[key] != item_index[key]],
+                    }
+
+                results['data_availability'][category_name] = {
+                    'status': 'success',
+                    'total': total_count,
+                    'pages_fetched': pages_fetched,
+                    'sample': items[:limit_per_category],
+                    'item_index': item_index,
+                    'changes': changes,
+                    'last_checked': self._now().strftime('%Y-%m-%d %H:%M:%S')
+                }
+                _log_event(logging.INFO, 'changes_category_checked', "[SUCCESS] %s: +%d -%d ~%d (%d halaman)",
+                           category_name.replace('_', ' ').title(), len(changes['added']),
+                           len(changes['removed']), len(changes['modified']), pages_fetched,
+                           domain=self.domain, category=category_name, added=len(changes['added']),
+                           removed=len(changes['removed']), modified=len(changes['modified']),
+                           pages_fetched=pages_fetched)
+
             except Exception as e:
+                _log_event(logging.ERROR, 'changes_category_error', "[ERROR] Error checking changes %s: %s",
+                           category_name, e, domain=self.domain, category=category_name, error=str(e))
                 results['data_availability'][category_name] = {
                     'status': 'error',
                     'error': str(e),
-                    'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    'last_checked': self._now().strftime('%Y-%m-%d %H:%M:%S')
+                }
+
+        _log_event(logging.INFO, 'changes_done', "[SUCCESS] Pengecekan perubahan selesai!", domain=self.domain)
+        return results
+
+    def save_changes_to_json(self, results, filename=None):
+        """
+        Menyimpan hanya delta perubahan dari hasil check_changes ke file JSON
+
+        Args:
+            results (dict): Hasil dari check_changes
+            filename (str): Nama file (optional, default akan menggunakan timestamp)
+        """
+        if filename is None:
+            timestamp = self._now().strftime('%Y%m%d_%H%M%S')
+            filename = f"bps_data_changes_{results.get('domain', self.domain)}_{timestamp}.json"
+
+        delta = {
+            'domain': results['domain'],
+            'domain_name': results['domain_name'],
+            'check_timestamp': results['check_timestamp'],
+            'previous_check_timestamp': results.get('previous_check_timestamp'),
+            'changes': {
+                category: data['changes'] if data['status'] == 'success' else {'error': data['error']}
+                for category, data in results['data_availability'].items()
+            }
+        }
+
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(delta, f, indent=2, ensure_ascii=False)
+
+        _log_event(logging.INFO, 'saved', "[SAVE] Perubahan disimpan ke: %s", filename, path=filename)
+        return filename
+
+    def _check_variable(self, var_id):
+        """
+        Mengecek periode dan turunan variabel (turvar) yang memiliki nilai
+        untuk satu variabel di domain checker ini
+
+        Args:
+            var_id (str): ID variabel BPS
+
+        Returns:
+            dict: Status, jumlah nilai per periode dan label turvar yang berisi
+        """
+        url = f"{self.base_url}/list/model/data/domain/{self.domain}/var/{var_id}/key/{self.api_key}"
+        data = self._get_json(url, 'data')
+
+        content = data.get('datacontent') or {}
+        if data.get('data-availability') != 'available' or not content:
+            return {'status': 'not_available', 'periods': {}, 'turvar': []}
+
+        vervars = [item['val'] for item in data.get('vervar') or []]
+        turvars = data.get('turvar') or [{'val': 0, 'label': ''}]
+        years = data.get('tahun') or []
+        subperiods = data.get('turtahun') or [{'val': 0, 'label': ''}]
+
+        # Kunci datacontent: vervar + var + turvar + tahun + turtahun
+        periods = {}
+        turvar_labels = set()
+        for year in years:
+            for subperiod in subperiods:
+                label = f"{year['label']} {subperiod['label']}".strip()
+                for turvar in turvars:
+                    count = sum(
+                        1 for vervar in vervars
+                        if f"{vervar}{var_id}{turvar['val']}{year['val']}{subperiod['val']}" in content
+                    )
+                    if count:
+                        periods[label] = periods.get(label, 0) + count
+                        turvar_labels.add(turvar['label'])
+
+        return {'status': 'available', 'periods': periods, 'turvar': sorted(turvar_labels)}
+
+    def check_variables(self, var_ids=None, catalog_path=VARIABLES_CSV, max_workers=8):
+        """
+        Mengecek ketersediaan data untuk banyak variabel sekaligus (default:
+        semua variabel di bps_variables.csv). Request per variabel dijalankan
+        paralel di thread pool.
+
+        Args:
+            var_ids (list): Daftar var_id (optional, default: seluruh katalog)
+            catalog_path (str): Lokasi CSV katalog var_id,title
+            max_workers (int): Jumlah maksimal request bersamaan
+
+        Returns:
+            dict: Matriks ketersediaan var_id x periode; 'rows' berisi jumlah
+                nilai per periode sesuai urutan 'periods' (0 = tidak ada data)
+        """
+        catalog = {}
+        for item in load_variable_catalog(catalog_path):
+            # Beberapa var_id muncul lebih dari sekali di katalog, pakai judul pertama
+            catalog.setdefault(item['var_id'], item['title'])
+        if var_ids is None:
+            var_ids = list(catalog)
+        var_ids = [str(var_id) for var_id in dict.fromkeys(var_ids)]
+
+        _log_event(logging.INFO, 'variables_start', "[CHECKING] Mengecek %d variabel untuk domain %s...",
+                   len(var_ids), self.domain, domain=self.domain, variables=len(var_ids))
+
+        def check(var_id):
+            try:
+                return var_id, self._check_variable(var_id)
+            except Exception as e:
+                return var_id, {'status': 'error', 'error': str(e), 'periods': {}, 'turvar': []}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            variables = dict(executor.map(check, var_ids))
+
+        periods = sorted({period for item in variables.values() for period in item['periods']})
+        results = {
+            'domain': self.domain,
+            'domain_name': self.domain_name,
+            'check_timestamp': self._now().strftime('%Y-%m-%d %H:%M:%S'),
+            'periods': periods,
+            'variables': {
+                var_id: {
+                    'title': catalog.get(var_id, ''),
+                    'status': item['status'],
+                    'turvar': item['turvar'],
+                    **({'error': item['error']} if 'error' in item else {})
                 }
-                print(f"[DATA] {category_name.replace('_', ' ').title()}: [ERROR] Error - {str(e)}")
+                for var_id, item in variables.items()
+            },
+            'rows': {
+                var_id: [item['periods'].get(period, 0) for period in periods]
+                for var_id, item in variables.items()
+            }
+        }
 
-        print("
-" + "=" * 70)
-        print("[SUCCESS] Pengecekan selesai!")
+        available = sum(1 for item in variables.values() if item['status'] == 'available')
+        _log_event(logging.INFO, 'variables_done', "[SUCCESS] %d dari %d variabel memiliki data",
+                   available, len(var_ids), domain=self.domain, available=available, variables=len(var_ids))
         return results
 
-    def save_results_to_json(self, results, filename=None):
+    def save_results_to_json(self, results, filename=None, compact=False, compression=None):
         """
         Menyimpan hasil pengecekan ke file JSON
 
         Args:
             results (dict): Hasil dari check_all_data_availability
             filename (str): Nama file (optional, default akan menggunakan timestamp)
+            compact (bool): Tulis JSON tanpa indentasi (memakai orjson jika terpasang)
+            compression (str): Kompresi file: None, 'gzip' atau 'zstd'
         """
         if filename is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"bps_data_availability_{self.domain}_{timestamp}.json"
+            timestamp = self._now().strftime('%Y%m%d_%H%M%S')
+            prefix = INCREMENTAL_SNAPSHOT_PREFIX if results.get('incremental') else SNAPSHOT_PREFIX
+            filename = f"{prefix}_{results.get('domain', self.domain)}_{timestamp}.json"
+            filename += COMPRESSION_SUFFIXES.get(compression, '')
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        payload = dump_json_bytes(results, compact=compact)
+        with _open_output(filename, compression) as f:
+            f.write(payload)
 
-        print(f"[SAVE] Hasil disimpan ke: {filename}")
+        _log_event(logging.INFO, 'saved', "[SAVE] Hasil disimpan ke: %s", filename, path=filename)
         return filename
 
 
-def main():
+class AvailabilityService:
     """
-    Fungsi utama untuk testing
+    Mode layanan: ketersediaan terakhir setiap (domain, kategori) disimpan di
+    memori dan dilayani lewat HTTP lokal (TCP atau Unix socket). Entry yang
+    sudah lewat refresh_interval tetap dilayani (stale-while-revalidate)
+    sambil diperbarui di latar belakang; jika refresh gagal, hasil lama
+    tetap dipakai dan error dicatat.
     """
-    # Ganti dengan API key Anda
-    API_KEY = 'f40723032cd619efc97acbc6a9a66272'  # API key dari project existing
 
-    # Inisialisasi checker
-    checker = BPSDataChecker(api_key=API_KEY, domain='7500')
+    def __init__(self, checker, domains=None, refresh_interval=3600, limit_per_category=5,
+                 max_workers=4, tick=None, allowed_domains=None, max_domains=64):
+        """
+        Args:
+            checker (BPSDataChecker): Checker yang dipakai untuk refresh
+            domains (list): Domain yang dipanaskan saat start (default: domain checker)
+            refresh_interval (float): Umur entry (detik) sebelum dianggap basi
+            limit_per_category (int): Jumlah maksimal sample per kategori
+            max_workers (int): Jumlah maksimal refresh bersamaan
+            tick (float): Jeda pengecekan entry basi oleh scheduler
+                (default: refresh_interval / 10, maksimal 60 detik)
+            allowed_domains (list): Domain tambahan yang boleh didaftarkan lewat
+                add_domain, selain DOMAIN_NAMES dan domains (optional)
+            max_domains (int): Jumlah maksimal domain terdaftar
+        """
+        self.checker = checker
+        self.domains = list(dict.fromkeys(domains or [checker.domain]))
+        self.allowed_domains = set(DOMAIN_NAMES) | set(self.domains) | set(allowed_domains or [])
+        self.max_domains = max(max_domains, len(self.domains))
+        self.categories = [name for name, _ in checker.get_check_functions()]
+        self.refresh_interval = refresh_interval
+        self.limit_per_category = limit_per_category
+        self.tick = tick or min(refresh_interval / 10, 60)
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.refreshing = set()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.server = None
+
+    def start(self):
+        """
+        Menjadwalkan refresh awal semua domain dan menjalankan scheduler
+        di thread latar belakang
+        """
+        for domain in self.domains:
+            self.refresh(domain)
+        self.thread = threading.Thread(target=self._schedule, name='bps-availability-scheduler', daemon=True)
+        self.thread.start()
+        return self
 
-    # Jalankan pengecekan menyeluruh
-    results = checker.check_all_data_availability()
+    def stop(self):
+        """
+        Menghentikan scheduler, server HTTP dan refresh yang belum berjalan
+        """
+        self.stop_event.set()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
 
-    # Simpan hasil ke file
-    checker.save_results_to_json(results)
+    def add_domain(self, domain):
+        """
+        Menambahkan domain ke daftar yang diperbarui scheduler. Hanya domain
+        di allowed_domains yang diterima, paling banyak max_domains.
 
-    # Tampilkan ringkasan
-    print("
-[SUMMARY] RINGKASAN KETERSEDIAAN DATA BPS GORONTALO")
-    print("=" * 50)
+        Args:
+            domain (str): Domain ID BPS
+
+        Returns:
+            bool: True jika domain baru ditambahkan, False jika sudah terdaftar
+
+        Raises:
+            ValueError: Jika domain tidak dikenal atau batas max_domains tercapai
+        """
+        if domain not in self.allowed_domains:
+            raise ValueError(f"Domain tidak dikenal: {domain}")
+        with self.lock:
+            if domain in self.domains:
+                return False
+            if len(self.domains) >= self.max_domains:
+                raise ValueError(f"Batas {self.max_domains} domain terdaftar sudah tercapai")
+            self.domains.append(domain)
+        self.refresh(domain)
+        return True
+
+    def refresh(self, domain, category=None):
+        """
+        Menjadwalkan refresh satu kategori (atau semua kategori) sebuah domain.
+        Kategori yang sedang di-refresh tidak dijadwalkan ulang.
+
+        Args:
+            domain (str): Domain ID BPS
+            category (str): Nama kategori (default: semua kategori)
+
+        Returns:
+            int: Jumlah refresh yang baru dijadwalkan
+        """
+        scheduled = 0
+        for name in [category] if category else self.categories:
+            with self.lock:
+                if (domain, name) in self.refreshing:
+                    continue
+                self.refreshing.add((domain, name))
+            try:
+                self.executor.submit(self._refresh, domain, name)
+            except RuntimeError:
+                # Executor sudah dihentikan
+                with self.lock:
+                    self.refreshing.discard((domain, name))
+                break
+            scheduled += 1
+        return scheduled
+
+    def _refresh(self, domain, category):
+        """
+        Mengecek satu kategori lewat checker dan menyimpan hasilnya
+        """
+        try:
+            checker = self.checker.for_domain(domain)
+            # Refresh latar belakang tidak boleh menahan pengecekan interaktif
+            checker.priority = 'bulk'
+            result = checker.check_category(category, self.limit_per_category)
+        except Exception as e:
+            result = {'status': 'error', 'error': str(e),
+                      'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        now = time.time()
+        with self.lock:
+            self.refreshing.discard((domain, category))
+            entry = self.entries.get((domain, category))
+            if result['status'] == 'success' or entry is None:
+                self.entries[(domain, category)] = {
+                    'result': result, 'updated_at': now, 'checked_at': now,
+                    'error': result.get('error'),
+                }
+            else:
+                # Stale-if-error: hasil terakhir yang berhasil tetap dilayani
+                entry['checked_at'] = now
+                entry['error'] = result['error']
+        _log_event(logging.DEBUG, 'service_refreshed', "[REFRESH] %s domain %s: %s", category, domain,
+                   result['status'], domain=domain, category=category, status=result['status'])
+
+    def _schedule(self):
+        """
+        Loop scheduler: jadwalkan refresh untuk entry yang belum ada atau basi
+        """
+        while not self.stop_event.wait(self.tick):
+            now = time.time()
+            with self.lock:
+                due = [
+                    (domain, category) for domain in self.domains for category in self.categories
+                    if (domain, category) not in self.refreshing
+                    and now - self.entries.get((domain, category), {}).get('checked_at', 0) >= self.refresh_interval
+                ]
+            for domain, category in due:
+                self.refresh(domain, category)
+
+    def get(self, domain, category):
+        """
+        Membaca entry dari memori tanpa menunggu request ke WebAPI. Entry
+        basi tetap dikembalikan dan refresh dijadwalkan di latar belakang.
+
+        Args:
+            domain (str): Domain ID BPS
+            category (str): Nama kategori
+
+        Returns:
+            dict: Hasil kategori beserta 'freshness', atau None jika belum
+                pernah dicek (refresh langsung dijadwalkan)
+        """
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get((domain, category))
+            refreshing = (domain, category) in self.refreshing
+            if entry is not None:
+                entry = dict(entry)
+        if entry is None:
+            if not refreshing:
+                self.refresh(domain, category)
+            return None
+
+        stale = now - entry['checked_at'] >= self.refresh_interval
+        if stale and not refreshing:
+            refreshing = self.refresh(domain, category) > 0
+        return dict(entry['result'], freshness={
+            'updated_at': datetime.fromtimestamp(entry['updated_at']).strftime('%Y-%m-%d %H:%M:%S'),
+            'age_seconds': round(now - entry['updated_at'], 3),
+            'stale': stale,
+            'refreshing': refreshing,
+            'last_error': entry['error'],
+        })
+
+    def domain_results(self, domain):
+        """
+        Hasil satu domain dari memori, dengan format seperti
+        check_all_data_availability (kategori yang belum dicek bernilai None)
+
+        Args:
+            domain (str): Domain ID BPS
+
+        Returns:
+            dict: Hasil domain
+        """
+        return {
+            'domain': domain,
+            'domain_name': DOMAIN_NAMES.get(domain, domain),
+            'check_timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'data_availability': {category: self.get(domain, category) for category in self.categories},
+        }
+
+    def status(self):
+        """
+        Ringkasan status layanan
+
+        Returns:
+            dict: Jumlah domain, entry, entry basi dan refresh yang berjalan
+        """
+        now = time.time()
+        with self.lock:
+            return {
+                'domains': list(self.domains),
+                'categories': list(self.categories),
+                'entries': len(self.entries),
+                'stale': sum(1 for entry in self.entries.values()
+                             if now - entry['checked_at'] >= self.refresh_interval),
+                'refreshing': len(self.refreshing),
+                'refresh_interval': self.refresh_interval,
+            }
+
+    def handle_path(self, method, path):
+        """
+        Routing API HTTP
+
+        GET  /health                         status layanan
+        GET  /availability                   semua domain
+        GET  /availability/{domain}          satu domain
+        GET  /availability/{domain}/{kategori}
+        POST /domains/{domain}               daftarkan domain (lihat add_domain)
+        POST /refresh/{domain}[/{kategori}]  paksa refresh di latar belakang
+
+        GET tidak pernah mendaftarkan domain; domain yang belum terdaftar
+        dijawab 404.
+
+        Returns:
+            tuple: (status HTTP, body dict)
+        """
+        parts = [part for part in path.split('?', 1)[0].split('/') if part]
+        if method == 'GET' and parts == ['health']:
+            return 200, self.status()
+        if method == 'GET' and parts == ['availability']:
+            with self.lock:
+                domains = list(self.domains)
+            return 200, {domain: self.domain_results(domain) for domain in domains}
+        if method == 'POST' and len(parts) == 2 and parts[0] == 'domains':
+            try:
+                added = self.add_domain(parts[1])
+            except ValueError as e:
+                return 403, {'error': str(e)}
+            return (201 if added else 200), {'domain': parts[1], 'registered': True}
+
+        if len(parts) in (2, 3) and parts[0] in ('availability', 'refresh'):
+            domain = parts[1]
+            category = parts[2] if len(parts) == 3 else None
+            with self.lock:
+                registered = domain in self.domains
+            if not registered:
+                return 404, {'error': f"Domain belum terdaftar: {domain} (daftarkan dengan POST /domains/{domain})"}
+            if category is not None and category not in self.categories:
+                return 404, {'error': f"Kategori tidak dikenal: {category}"}
+
+            if method == 'POST' and parts[0] == 'refresh':
+                return 202, {'scheduled': self.refresh(domain, category)}
+            if method == 'GET' and parts[0] == 'availability':
+                if category is None:
+                    return 200, self.domain_results(domain)
+                result = self.get(domain, category)
+                if result is None:
+                    return 202, {'status': 'pending', 'domain': domain, 'category': category}
+                return 200, result
+        return 404, {'error': f"Endpoint tidak dikenal: {method} {path}"}
+
+    def serve(self, address='127.0.0.1:8080'):
+        """
+        Menjalankan API HTTP sampai dihentikan (blocking)
+
+        Args:
+            address (str): 'host:port' atau 'unix:/path/ke/socket'
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        import socketserver
+        import stat
+
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Header dan body ditulis terpisah; tanpa ini keep-alive tertahan delayed ACK
+            disable_nagle_algorithm = True
+
+            def _reply(self, method):
+                status, body = service.handle_path(method, self.path)
+                payload = dump_json_bytes(body, compact=True)
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                self._reply('GET')
+
+            def do_POST(self):
+                self._reply('POST')
+
+            def address_string(self):
+                return str(self.client_address[0]) if self.client_address else 'unix'
+
+            def log_message(self, format, *args):
+                _log_event(logging.DEBUG, 'service_request', "[HTTP] " + format, *args)
+
+        if address.startswith('unix:'):
+            path = address[len('unix:'):]
+            if os.path.lexists(path):
+                # Hanya socket sisa run sebelumnya yang dihapus, bukan file lain
+                if not stat.S_ISSOCK(os.lstat(path).st_mode):
+                    raise FileExistsError(f"{path} sudah ada dan bukan Unix socket, tidak dihapus")
+                os.unlink(path)
+
+            class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+                daemon_threads = True
+
+            self.server = UnixHTTPServer(path, Handler)
+        else:
+            host, _, port = address.rpartition(':')
+            self.server = ThreadingHTTPServer((host or '127.0.0.1', int(port)), Handler)
+            self.server.daemon_threads = True
+
+        _log_event(logging.INFO, 'service_start', "[SERVE] Layanan ketersediaan data di %s (%d domain, refresh %ss)",
+                   address, len(self.domains), self.refresh_interval, address=address, domains=len(self.domains))
+        self.server.serve_forever()
+
+
+def _item_key(item, id_field):
+    """
+    ID item katalog (hash isi item jika field ID tidak ada)
+    """
+    value = item.get(id_field)
+    if value is None:
+        return _item_hash(item)
+    return str(value)
+
+
+def _item_version(item, date_field):
+    """
+    Versi item untuk deteksi perubahan: tanggal update jika ada, jika tidak
+    hash isi item
+    """
+    if date_field and item.get(date_field):
+        return str(item[date_field])
+    return _item_hash(item)
+
+
+def _item_hash(item):
+    """
+    Hash pendek dan stabil dari isi item
+    """
+    payload = json.dumps(item, sort_keys=True, ensure_ascii=False, default=_json_default)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+
+
+def dump_json_bytes(results, compact=False):
+    """
+    Serialisasi hasil pengecekan ke bytes JSON UTF-8
+
+    Args:
+        results (dict): Hasil pengecekan
+        compact (bool): Tanpa indentasi/spasi; memakai orjson jika terpasang
+
+    Returns:
+        bytes: JSON ter-encode UTF-8
+    """
+    if not compact:
+        return json.dumps(results, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+    if orjson is not None:
+        return orjson.dumps(results, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(results, separators=(',', ':'), ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _open_output(filename, compression=None):
+    """
+    Membuka file output biner, dengan kompresi gzip/zstd jika diminta
+    """
+    if compression is None:
+        return open(filename, 'wb')
+    if compression == 'gzip':
+        return gzip.open(filename, 'wb')
+    if compression == 'zstd':
+        if zstandard is None:
+            raise ImportError("Kompresi zstd membutuhkan package 'zstandard' (pip install zstandard)")
+        return zstandard.open(filename, 'wb')
+    raise ValueError(f"Kompresi tidak dikenal: {compression}")
+
+
+def load_results_from_json(filename):
+    """
+    Membaca hasil pengecekan yang disimpan dengan save_results_to_json
+    (termasuk file .gz/.zst)
+
+    Args:
+        filename (str): Lokasi file JSON
+
+    Returns:
+        dict: Hasil pengecekan
+    """
+    if filename.endswith('.gz'):
+        opener = gzip.open
+    elif filename.endswith('.zst'):
+        if zstandard is None:
+            raise ImportError("Membaca file .zst membutuhkan package 'zstandard' (pip install zstandard)")
+        opener = zstandard.open
+    else:
+        opener = open
+    with opener(filename, 'rb') as f:
+        return json.loads(f.read())
+
+
+def write_ndjson(records, filename='-', compression=None):
+    """
+    Menulis record (mis. dari iter_availability) sebagai JSON lines, satu
+    baris per record, dan langsung di-flush setelah setiap baris
+
+    Args:
+        records (iterable): Record dict yang akan ditulis
+        filename (str): Lokasi file, '-' untuk stdout, atau file object biner
+        compression (str): Kompresi file: None, 'gzip' atau 'zstd'
+
+    Returns:
+        int: Jumlah record yang ditulis
+    """
+    if filename == '-':
+        output = sys.stdout.buffer
+        close = False
+    elif hasattr(filename, 'write'):
+        output = filename
+        close = False
+    else:
+        output = _open_output(filename, compression)
+        close = True
+
+    count = 0
+    try:
+        for record in records:
+            output.write(dump_json_bytes(record, compact=True) + b'\n')
+            output.flush()
+            count += 1
+    finally:
+        if close:
+            output.close()
+    return count
+
+def _import_pyarrow():
+    """
+    Import pyarrow dan pyarrow.dataset saat pertama dibutuhkan
+
+    Returns:
+        tuple: (pyarrow, pyarrow.dataset)
+    """
+    try:
+        import pyarrow
+        import pyarrow.dataset
+    except ImportError:
+        raise ImportError("Dataset Parquet membutuhkan package 'pyarrow' (pip install pyarrow)") from None
+    return pyarrow, pyarrow.dataset
+
+
+def _parquet_schema(pa):
+    """
+    Schema baris dataset Parquet (lihat PARQUET_COLUMNS)
+    """
+    return pa.schema([
+        ('run_ts', pa.timestamp('s')),
+        ('run_date', pa.string()),
+        ('domain', pa.string()),
+        ('category', pa.string()),
+        ('status', pa.string()),
+        ('total', pa.int64()),
+        ('item_id', pa.string()),
+        ('title', pa.string()),
+        ('updt_date', pa.string()),
+    ])
+
+
+def availability_rows(results):
+    """
+    Mengubah hasil pengecekan satu domain menjadi baris ternormalisasi
+    (run_ts, run_date, domain, category, status, total, item_id, title,
+    updt_date). Kategori tanpa item sample tetap menghasilkan satu baris
+    dengan item_id None agar status dan jumlahnya tercatat.
+
+    Args:
+        results (dict): Hasil pengecekan satu domain
+
+    Yields:
+        dict: Satu baris
+    """
+    run_ts = datetime.strptime(results['check_timestamp'], '%Y-%m-%d %H:%M:%S')
+    base = {'run_ts': run_ts, 'run_date': run_ts.strftime('%Y-%m-%d'), 'domain': str(results['domain'])}
+
+    for category, data in (results.get('data_availability') or {}).items():
+        if not data:
+            continue
+        spec = CATEGORIES.get(category, {})
+        total = data.get(spec.get('count_key'), data.get('total'))
+        row = dict(base, category=category, status=data.get('status'),
+                   total=int(total) if total is not None else None,
+                   item_id=None, title=None, updt_date=None)
+
+        items = data.get(spec.get('sample_key'), data.get('sample'))
+        if items is None:
+            # result_level='summary' hanya menyimpan ID
+            items = [{'_id': item_id} for item_id in data.get('sample_ids') or []]
+            id_field = '_id'
+        else:
+            id_field = spec.get('id_field')
+
+        if not items:
+            yield row
+            continue
+        date_field = spec.get('date_field')
+        for item in items:
+            date = item.get(date_field) if date_field else item.get('updt_date') or item.get('rl_date')
+            title = next((item[field] for field in CatalogIndex.TITLE_FIELDS if item.get(field)), None)
+            yield dict(row, item_id=str(_item_key(item, id_field)),
+                       title=str(title) if title is not None else None,
+                       updt_date=str(date) if date else None)
+
+
+def load_parquet_dataset(path='bps_dataset', columns=None, domains=None, categories=None,
+                         since=None, until=None, as_pandas=True):
+    """
+    Membaca dataset dari ParquetSink. Hanya kolom yang diminta yang dibaca,
+    dan filter domain/tanggal run memangkas partisi yang tidak dibutuhkan.
+
+    Args:
+        path (str): Direktori dataset Parquet
+        columns (list): Kolom yang dibaca (default: semua, lihat PARQUET_COLUMNS)
+        domains (list): Hanya domain ini (optional)
+        categories (list): Hanya kategori ini (optional)
+        since (str): Tanggal run minimal 'YYYY-MM-DD' (optional)
+        until (str): Tanggal run maksimal 'YYYY-MM-DD' (optional)
+        as_pandas (bool): Kembalikan pandas.DataFrame (False: pyarrow.Table)
+
+    Returns:
+        pandas.DataFrame/pyarrow.Table: Baris yang cocok
+    """
+    pa, ds = _import_pyarrow()
+    schema = _parquet_schema(pa)
+    # Nilai kolom partisi dibaca dari nama direktori (mis. run_date=2026-01-27/domain=7500)
+    # sebagai string, agar domain '0000' tidak berubah menjadi angka
+    partitioning = ds.partitioning(
+        pa.schema([(column, pa.string()) for column in PARQUET_PARTITIONS]), flavor='hive'
+    )
+    dataset = ds.dataset(path, format='parquet', partitioning=partitioning, schema=schema)
+
+    expression = None
+    conditions = []
+    if domains:
+        conditions.append(ds.field('domain').isin([str(domain) for domain in domains]))
+    if categories:
+        conditions.append(ds.field('category').isin(list(categories)))
+    if since:
+        conditions.append(ds.field('run_date') >= since)
+    if until:
+        conditions.append(ds.field('run_date') <= until)
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+
+    table = dataset.to_table(columns=columns, filter=expression)
+    return table.to_pandas() if as_pandas else table
+
+
+def load_variable_catalog(path=VARIABLES_CSV):
+    """
+    Membaca katalog variabel BPS (CSV dengan kolom var_id,title)
+
+    Args:
+        path (str): Lokasi file CSV
+
+    Returns:
+        list: Daftar dict {'var_id', 'title'}
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return [
+            {'var_id': row['var_id'].strip(), 'title': row['title'].strip()}
+            for row in csv.DictReader(f)
+            if row.get('var_id')
+        ]
+
+def find_latest_snapshot(domain, directory='.', incremental=True):
+    """
+    Mencari file hasil pengecekan terbaru untuk sebuah domain
+
+    Args:
+        domain (str): Domain ID BPS
+        directory (str): Direktori tempat file hasil disimpan
+        incremental (bool): Hanya cari snapshot dari check_changes
+
+    Returns:
+        str: Lokasi file terbaru, atau None jika tidak ada
+    """
+    def timestamp(filename):
+        return os.path.basename(filename).split(f"_{domain}_", 1)[1]
+
+    def snapshots(prefix):
+        # Terbaru lebih dulu menurut timestamp di nama file
+        return sorted(glob.glob(os.path.join(directory, f"{prefix}_{domain}_*.json*")), key=timestamp, reverse=True)
+
+    incremental_files = snapshots(INCREMENTAL_SNAPSHOT_PREFIX)
+    if not incremental:
+        candidates = incremental_files[:1] + snapshots(SNAPSHOT_PREFIX)[:1]
+        return max(candidates, key=timestamp) if candidates else None
+    if incremental_files:
+        return incremental_files[0]
+
+    # Snapshot incremental lama ditulis dengan awalan file hasil biasa
+    for filename in snapshots(SNAPSHOT_PREFIX):
+        try:
+            if load_results_from_json(filename).get('incremental'):
+                return filename
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+def print_summary(results):
+    """
+    Menampilkan ringkasan jumlah data per kategori lewat logger
+    (event 'summary', satu record per kategori)
+
+    Args:
+        results (dict): Hasil dari check_all_data_availability
+    """
+    domain = results['domain']
+    _log_event(logging.INFO, 'summary_start', "\n[SUMMARY] RINGKASAN KETERSEDIAAN DATA BPS %s",
+               results.get('domain_name', domain).upper(), domain=domain)
 
     for category, data in results['data_availability'].items():
+        label = category.replace('_', ' ').title()
         if data['status'] == 'success':
-            # Cari field yang menunjukkan jumlah total
-            total_field = None
-            if 'total_tables' in data:
-                total_field = 'total_tables'
-            elif 'total_publications' in data:
-                total_field = 'total_publications'
-            elif 'total_press_releases' in data:
-                total_field = 'total_press_releases'
-            elif 'total_indicators' in data:
-                total_field = 'total_indicators'
-            elif 'total_news' in data:
-                total_field = 'total_news'
-            elif 'total_infographics' in data:
-                total_field = 'total_infographics'
-            elif 'total_subjects' in data:
-                total_field = 'total_subjects'
+            # Field jumlah total diambil dari registry kategori; snapshot
+            # incremental menyimpannya sebagai 'total'
+            total_field = CATEGORIES.get(category, {}).get('count_key')
+            if total_field not in data:
+                total_field = 'total' if 'total' in data else None
 
             if total_field:
-                print(f"[DATA] {category.replace('_', ' ').title()}: {data[total_field]} items")
+                _log_event(logging.INFO, 'summary', "[DATA] %s: %s items", label, data[total_field],
+                           domain=domain, category=category, status='success', total=data[total_field])
+            else:
+                _log_event(logging.INFO, 'summary', "[DATA] %s: Available", label,
+                           domain=domain, category=category, status='success')
+        else:
+            error = data.get('error', 'Unknown error')
+            _log_event(logging.INFO, 'summary', "[DATA] %s: Error - %s", label, error,
+                       domain=domain, category=category, status='error', error=error)
+
+
+def _replay_run_arg(value):
+    """
+    Tipe argparse untuk --replay-run: ID run (bilangan bulat positif) atau 'all'
+    """
+    if value == 'all':
+        return value
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    raise argparse.ArgumentTypeError(f"harus ID run (bilangan bulat positif) atau 'all', bukan {value!r}")
+
+
+def parse_args(argv=None):
+    """
+    Membaca argumen command line
+    """
+    parser = argparse.ArgumentParser(
+        description="BPS Data Availability Checker",
+        epilog="Perintah snapshot (tanpa akses WebAPI): 'summary FILE...', 'latest DOMAIN', "
+               "'index FILE...', 'search KATA KUNCI', 'parquet FILE...' dan 'archive PATH'. "
+               "Lihat '%(prog)s summary --help'."
+    )
+    parser.add_argument('--api-key', default='f40723032cd619efc97acbc6a9a66272',
+                        help="API key WebAPI BPS")
+    parser.add_argument('--domain', default='7500',
+                        help="Domain ID BPS untuk pengecekan satu domain (default: 7500)")
+    parser.add_argument('--domains', nargs='+', metavar='DOMAIN',
+                        help="Daftar domain ID BPS untuk pengecekan banyak domain")
+    parser.add_argument('--all-provinces', action='store_true',
+                        help="Cek semua domain provinsi")
+    parser.add_argument('--domain-type', choices=['all', 'prov', 'kab'],
+                        help="Ambil daftar domain dari WebAPI (all, prov, kab)")
+    parser.add_argument('--categories', nargs='+', choices=list(CATEGORIES), metavar='CATEGORY',
+                        help="Kategori yang dicek (default: semua kategori standar)")
+    parser.add_argument('--limit', type=int, default=5,
+                        help="Jumlah maksimal sample per kategori (default: 5)")
+    parser.add_argument('--concurrent', action='store_true',
+                        help="Jalankan semua kategori secara bersamaan")
+    parser.add_argument('--max-workers', type=int, default=8,
+                        help="Jumlah maksimal job bersamaan (default: 8)")
+    parser.add_argument('--rps', type=float, default=None,
+                        help="Batas global request per detik")
+    parser.add_argument('--adaptive', action='store_true',
+                        help="Atur jumlah request bersamaan secara adaptif (AIMD), maksimal --max-workers")
+    parser.add_argument('--scheduler', action='store_true',
+                        help="Antrian prioritas request: pengecekan interaktif didahulukan dari crawl bulk "
+                             "dan domain dilayani bergiliran (selalu aktif dengan --serve)")
+    parser.add_argument('--all-pages', action='store_true',
+                        help="Ambil semua halaman list WebAPI, bukan hanya halaman pertama")
+    parser.add_argument('--result-level', choices=RESULT_LEVELS, default='samples',
+                        help="Level detail hasil per kategori (default: samples)")
+    parser.add_argument('--compact', action='store_true',
+                        help="Simpan JSON tanpa indentasi")
+    parser.add_argument('--compress', choices=sorted(COMPRESSION_SUFFIXES),
+                        help="Kompresi file hasil (gzip atau zstd)")
+    parser.add_argument('--ndjson', metavar='PATH',
+                        help="Tulis satu record JSON per (domain, kategori) ke PATH begitu selesai ('-' untuk stdout)")
+    parser.add_argument('--variables', nargs='?', const=VARIABLES_CSV, metavar='CSV',
+                        help="Cek ketersediaan data setiap variabel di katalog CSV (default: bps_variables.csv)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Bandingkan dengan snapshot terakhir dan simpan hanya perubahannya")
+    parser.add_argument('--use-stadata', action='store_true',
+                        help="Cek static/dynamic tables lewat DataFrame stadata")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="Hanya tampilkan warning dan error")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="Tampilkan detail setiap request kategori")
+    parser.add_argument('--log-format', choices=LOG_FORMATS, default='text',
+                        help="Format log progres: text atau json (satu objek per baris)")
+    parser.add_argument('--serve', metavar='ADDR',
+                        help="Jalankan layanan HTTP di ADDR ('host:port' atau 'unix:/path/socket') "
+                             "yang melayani ketersediaan dari memori")
+    parser.add_argument('--refresh-interval', type=float, default=3600,
+                        help="Mode --serve: umur data (detik) sebelum di-refresh di latar belakang (default: 3600)")
+    parser.add_argument('--index', metavar='PATH',
+                        help="Indeks setiap item yang diambil ke indeks pencarian SQLite di PATH")
+    parser.add_argument('--parquet', metavar='PATH',
+                        help="Tambahkan baris hasil ke dataset Parquet di PATH (butuh pyarrow)")
+    parser.add_argument('--metrics', metavar='PATH',
+                        help="Simpan timing setiap request dalam format Prometheus ke PATH")
+    parser.add_argument('--checkpoint', metavar='PATH',
+                        help="Catat setiap kategori/halaman yang selesai ke journal PATH")
+    parser.add_argument('--resume', action='store_true',
+                        help="Lanjutkan run dari journal checkpoint, lewati unit yang sudah selesai")
+    archive = parser.add_mutually_exclusive_group()
+    archive.add_argument('--archive', metavar='PATH',
+                         help="Rekam setiap response WebAPI sebagai run baru di arsip SQLite PATH")
+    archive.add_argument('--replay', metavar='PATH',
+                         help="Jalankan pengecekan dari arsip PATH tanpa akses jaringan")
+    parser.add_argument('--replay-run', type=_replay_run_arg, default=None, metavar='ID',
+                        help="Mode --replay: ID run yang dipakai atau 'all' untuk semua run (default: run terakhir)")
+    parser.add_argument('--cache', metavar='PATH',
+                        help="Simpan response ke cache SQLite di PATH")
+    parser.add_argument('--cache-ttl', type=int, default=3600,
+                        help="TTL cache dalam detik (default: 3600)")
+    args = parser.parse_args(argv)
+    if args.replay_run is not None and not args.replay:
+        parser.error("--replay-run hanya berlaku bersama --replay")
+    if args.replay and not os.path.exists(args.replay):
+        parser.error(f"arsip {args.replay} tidak ditemukan")
+    if isinstance(args.replay_run, int):
+        try:
+            ResponseArchive(args.replay, mode='replay', run_id=args.replay_run).close()
+        except ValueError as e:
+            parser.error(str(e))
+    return args
+
+
+SNAPSHOT_COMMANDS = ('summary', 'latest', 'index', 'search', 'parquet', 'archive')
+
+
+def snapshot_main(argv):
+    """
+    Perintah yang hanya membaca file hasil yang sudah disimpan, tanpa
+    membuat checker (stadata, pandas dan requests tidak diimport)
+
+    Args:
+        argv (list): Argumen command line, diawali nama perintah
+    """
+    parser = argparse.ArgumentParser(description="Perintah snapshot BPS Data Checker")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    summary = commands.add_parser('summary', help="Tampilkan ringkasan file hasil pengecekan")
+    summary.add_argument('files', nargs='+', metavar='FILE',
+                         help="File hasil save_results_to_json (.json, .json.gz, .json.zst)")
+    summary.add_argument('--log-format', choices=LOG_FORMATS, default='text',
+                         help="Format output: text atau json (satu objek per baris)")
+
+    latest = commands.add_parser('latest', help="Tampilkan lokasi file hasil terbaru sebuah domain")
+    latest.add_argument('domain', help="Domain ID BPS")
+    latest.add_argument('--directory', default='.',
+                        help="Direktori file hasil (default: direktori kerja)")
+    latest.add_argument('--incremental', action='store_true',
+                        help="Hanya snapshot dari mode --incremental")
+
+    index = commands.add_parser('index', help="Indeks item sample dari file hasil ke indeks pencarian")
+    index.add_argument('files', nargs='+', metavar='FILE',
+                       help="File hasil save_results_to_json (.json, .json.gz, .json.zst)")
+    index.add_argument('--index', default='bps_index.sqlite', metavar='PATH',
+                       help="Lokasi indeks SQLite (default: bps_index.sqlite)")
+
+    search = commands.add_parser('search', help="Cari item di indeks lokal berdasarkan kata kunci dan filter")
+    search.add_argument('query', nargs='*', help="Kata kunci judul/subjek")
+    search.add_argument('--index', default='bps_index.sqlite', metavar='PATH',
+                        help="Lokasi indeks SQLite (default: bps_index.sqlite)")
+    search.add_argument('--domains', nargs='+', metavar='DOMAIN', help="Hanya domain ini")
+    search.add_argument('--categories', nargs='+', choices=list(CATEGORIES), metavar='CATEGORY',
+                        help="Hanya kategori ini")
+    search.add_argument('--since', metavar='YYYY-MM-DD', help="Tanggal item minimal")
+    search.add_argument('--until', metavar='YYYY-MM-DD', help="Tanggal item maksimal")
+    search.add_argument('--var-id', help="Hanya item dengan var_id ini")
+    search.add_argument('--variable', metavar='VAR_ID',
+                        help="Cari item yang cocok dengan variabel di katalog CSV (var_id atau judulnya)")
+    search.add_argument('--catalog', default=VARIABLES_CSV, metavar='CSV',
+                        help="Katalog variabel untuk --variable (default: bps_variables.csv)")
+    search.add_argument('--limit', type=int, default=50, help="Jumlah maksimal hasil (default: 50)")
+    search.add_argument('--json', action='store_true', help="Tulis hasil sebagai JSON lines")
+
+    parquet = commands.add_parser('parquet', help="Tambahkan file hasil ke dataset Parquet (butuh pyarrow)")
+    parquet.add_argument('files', nargs='+', metavar='FILE',
+                         help="File hasil save_results_to_json (.json, .json.gz, .json.zst)")
+    parquet.add_argument('--dataset', default='bps_dataset', metavar='PATH',
+                         help="Direktori dataset Parquet (default: bps_dataset)")
+
+    archive = commands.add_parser('archive', help="Tampilkan daftar run di arsip response (--archive)")
+    archive.add_argument('path', metavar='PATH', help="File SQLite arsip response")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'archive':
+        if not os.path.exists(args.path):
+            print(f"[ERROR] Arsip {args.path} tidak ditemukan", file=sys.stderr)
+            return 1
+        try:
+            response_archive = ResponseArchive(args.path, mode='replay')
+        except ValueError as e:
+            print(f"[ERROR] {e}", file=sys.stderr)
+            return 1
+        try:
+            for run in response_archive.runs():
+                print(f"{run['run_id']:>6}  {run['started_at']}  {run['responses']} response")
+        finally:
+            response_archive.close()
+        return 0
+
+    if args.command == 'parquet':
+        with ParquetSink(args.dataset) as sink:
+            for filename in args.files:
+                count = sink.add_results(load_results_from_json(filename))
+                print(f"[PARQUET] {count} baris dari {filename}")
+        return 0
+
+    if args.command == 'index':
+        catalog_index = CatalogIndex(args.index)
+        try:
+            for filename in args.files:
+                count = catalog_index.add_results(load_results_from_json(filename))
+                print(f"[INDEX] {count} item dari {filename}")
+        finally:
+            catalog_index.close()
+        return 0
+
+    if args.command == 'search':
+        if not os.path.exists(args.index):
+            print(f"[ERROR] Indeks {args.index} belum ada, isi dengan --index saat pengecekan "
+                  f"atau perintah 'index'", file=sys.stderr)
+            return 1
+        catalog_index = CatalogIndex(args.index)
+        filters = {'domains': args.domains, 'categories': args.categories, 'since': args.since, 'until': args.until}
+        try:
+            if args.variable:
+                hits = catalog_index.search_variable(args.variable, catalog_path=args.catalog,
+                                                     limit=args.limit, **filters)
+            else:
+                hits = catalog_index.search(' '.join(args.query), var_id=args.var_id, limit=args.limit, **filters)
+        finally:
+            catalog_index.close()
+
+        for hit in hits:
+            if args.json:
+                print(json.dumps(hit, ensure_ascii=False))
             else:
-                print(f"[DATA] {category.replace('_', ' ').title()}: Available")
+                print(f"{hit['domain']}  {hit['category']:<20}  {hit['item_id']:<10}  {hit['date'] or '-':<10}  {hit['title']}")
+        if not args.json:
+            print(f"[SEARCH] {len(hits)} item ditemukan", file=sys.stderr)
+        return 0
+
+    if args.command == 'latest':
+        filename = find_latest_snapshot(args.domain, args.directory, incremental=args.incremental)
+        if filename is None:
+            print(f"[ERROR] Tidak ada file hasil untuk domain {args.domain} di {args.directory}", file=sys.stderr)
+            return 1
+        print(filename)
+        return 0
+
+    configure_logging(fmt=args.log_format)
+    try:
+        for filename in args.files:
+            print_summary(load_results_from_json(filename))
+    finally:
+        stop_logging()
+    return 0
+
+
+def main(argv=None):
+    """
+    Fungsi utama untuk testing
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] in SNAPSHOT_COMMANDS:
+        return snapshot_main(argv)
+    if argv and argv[0] == 'check':
+        argv = argv[1:]
+    args = parse_args(argv)
+
+    # Saat NDJSON ditulis ke stdout, log dikirim ke stderr agar stdout hanya berisi JSON lines
+    configure_logging(level='WARNING' if args.quiet else 'DEBUG' if args.verbose else 'INFO',
+                      fmt=args.log_format, stream=sys.stderr if args.ndjson == '-' else sys.stdout)
+
+    # Inisialisasi checker
+    cache = ResponseCache(args.cache, default_ttl=args.cache_ttl) if args.cache else None
+    journal = None
+    if args.checkpoint or args.resume:
+        journal = CheckpointJournal(args.checkpoint or 'bps_checkpoint.ndjson', resume=args.resume)
+    metrics = RequestMetrics() if args.metrics else None
+    catalog_index = CatalogIndex(args.index) if args.index else None
+    sink = ParquetSink(args.parquet) if args.parquet else None
+    archive = ResponseArchive(args.archive) if args.archive else None
+    checker = BPSDataChecker(api_key=args.api_key, domain=args.domain, all_pages=args.all_pages, cache=cache,
+                             result_level=args.result_level, use_stadata=args.use_stadata, journal=journal,
+                             concurrency=shared_concurrency(maximum=args.max_workers) if args.adaptive else None,
+                             categories=args.categories, request_hooks=[metrics] if metrics else None,
+                             index=catalog_index, archive=archive,
+                             scheduler=cli_scheduler(args) if args.scheduler or args.serve else None)
+
+    try:
+        if args.replay:
+            replay_checks(checker, args, sink)
+        else:
+            run_checks(checker, args, sink)
+    finally:
+        if sink is not None:
+            sink.close()
+        if archive is not None:
+            archive.close()
+            _log_event(logging.INFO, 'saved', "[SAVE] Response disimpan ke arsip: %s (run %d)",
+                       args.archive, archive.run_id, path=args.archive, run_id=archive.run_id)
+        if metrics is not None:
+            metrics.write_prometheus(args.metrics)
+            _log_event(logging.INFO, 'saved', "[SAVE] Metrik disimpan ke: %s", args.metrics, path=args.metrics)
+        if journal is not None:
+            journal.close()
+        if catalog_index is not None:
+            catalog_index.close()
+        stop_logging()
+
+
+def cli_scheduler(args):
+    """
+    Scheduler bersama untuk CLI: --max-workers request berjalan bersamaan,
+    satu slot dicadangkan untuk request interactive jika memungkinkan
+
+    Args:
+        args (argparse.Namespace): Hasil parse_args
+
+    Returns:
+        RequestScheduler: Scheduler bersama
+    """
+    return shared_scheduler(max_in_flight=args.max_workers, reserved_interactive=1 if args.max_workers > 1 else 0)
+
+
+def replay_checks(checker, args, sink=None):
+    """
+    Menjalankan run_checks dari arsip response untuk satu run atau semua run
+    (--replay-run all), tanpa akses jaringan. Hasil setiap run disimpan
+    dengan waktu run aslinya.
+
+    Args:
+        checker (BPSDataChecker): Checker yang sudah dikonfigurasi
+        args (argparse.Namespace): Hasil parse_args
+        sink (ParquetSink): Dataset Parquet untuk setiap hasil domain (optional)
+    """
+    if args.replay_run == 'all':
+        response_archive = ResponseArchive(args.replay, mode='replay')
+        run_ids = [run['run_id'] for run in response_archive.runs()]
+        response_archive.close()
+    else:
+        run_ids = [args.replay_run]
+
+    for run_id in run_ids:
+        checker.archive = ResponseArchive(args.replay, mode='replay', run_id=run_id)
+        _log_event(logging.INFO, 'replay_start', "[REPLAY] Run %d (%s) dari arsip %s", checker.archive.run_id,
+                   checker.archive.started_at, args.replay, run_id=checker.archive.run_id, path=args.replay)
+        try:
+            run_checks(checker, args, sink)
+        finally:
+            checker.archive.close()
+            checker.archive = None
+
+
+def run_checks(checker, args, sink=None):
+    """
+    Menjalankan mode pengecekan sesuai argumen command line
+
+    Args:
+        checker (BPSDataChecker): Checker yang sudah dikonfigurasi
+        args (argparse.Namespace): Hasil parse_args
+        sink (ParquetSink): Dataset Parquet untuk setiap hasil domain (optional)
+    """
+    domains = list(args.domains or [])
+    if args.all_provinces:
+        domains.extend(PROVINCE_DOMAINS)
+    if args.domain_type:
+        domains.extend(item['domain_id'] for item in checker.fetch_domain_list(args.domain_type))
+
+    if args.serve:
+        if args.rps:
+            checker.rate_limiter = shared_rate_limiter(args.rps)
+        service = AvailabilityService(checker, domains or [args.domain], refresh_interval=args.refresh_interval,
+                                      limit_per_category=args.limit, max_workers=args.max_workers)
+        import signal
+        # SIGTERM (mis. dari systemd) diperlakukan seperti Ctrl-C agar metrik/journal tetap ditutup rapi
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        service.start()
+        try:
+            service.serve(args.serve)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            service.stop()
+        return
+
+    if args.ndjson:
+        records = checker.iter_availability(domains or [args.domain], limit_per_category=args.limit,
+                                            max_workers=args.max_workers, requests_per_second=args.rps)
+        if args.ndjson == '-':
+            write_ndjson(records, sys.stdout.buffer)
         else:
-            print(f"[DATA] {category.replace('_', ' ').title()}: Error - {data.get('error', 'Unknown error')}")
+            count = write_ndjson(records, args.ndjson, compression=args.compress)
+            _log_event(logging.INFO, 'saved', "[SAVE] %d record disimpan ke: %s", count, args.ndjson,
+                       path=args.ndjson, records=count)
+        return
+
+    if args.rps:
+        checker.rate_limiter = shared_rate_limiter(args.rps)
+
+    if args.variables:
+        # Satu matriks variabel per domain; request variabel di setiap domain sudah paralel
+        for domain in domains or [args.domain]:
+            results = checker.for_domain(domain).check_variables(catalog_path=args.variables,
+                                                                 max_workers=args.max_workers)
+            timestamp = checker._now().strftime('%Y%m%d_%H%M%S')
+            filename = f"bps_variable_availability_{domain}_{timestamp}.json"
+            checker.save_results_to_json(results, filename + COMPRESSION_SUFFIXES.get(args.compress, ''),
+                                         compact=args.compact, compression=args.compress)
+        return
+
+    if args.incremental:
+        # Setiap domain dibandingkan dengan snapshot incremental terakhirnya,
+        # hasil disimpan begitu domain tersebut selesai
+        targets = domains or [args.domain]
+        with ThreadPoolExecutor(max_workers=max(1, min(args.max_workers, len(targets)))) as executor:
+            futures = [executor.submit(checker.for_domain(domain).check_changes, limit_per_category=args.limit)
+                       for domain in targets]
+            for future in as_completed(futures):
+                results = future.result()
+                checker.save_results_to_json(results, compact=args.compact, compression=args.compress)
+                if sink is not None:
+                    sink.add_results(results)
+                checker.save_changes_to_json(results)
+                if domains:
+                    print_summary(results)
+        return
+
+    if domains:
+        # Pengecekan banyak domain, hasil disimpan begitu tiap domain selesai
+        for results in checker.check_domains(domains, limit_per_category=args.limit,
+                                             max_workers=args.max_workers,
+                                             requests_per_second=args.rps):
+            checker.save_results_to_json(results, compact=args.compact, compression=args.compress)
+            if sink is not None:
+                sink.add_results(results)
+            print_summary(results)
+        return
+
+    # Jalankan pengecekan menyeluruh
+    results = checker.check_all_data_availability(limit_per_category=args.limit,
+                                                  concurrent=args.concurrent,
+                                                  max_workers=args.max_workers)
+
+    # Simpan hasil ke file
+    checker.save_results_to_json(results, compact=args.compact, compression=args.compress)
+    if sink is not None:
+        sink.add_results(results)
+
+    # Tampilkan ringkasan
+    print_summary(results)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
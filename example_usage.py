@@ -2,13 +2,16 @@
 Contoh penggunaan BPS Data Checker
 """
 
-from bps_data_checker import BPSDataChecker
+from bps_data_checker import BPSDataChecker, configure_logging
 import json
 
 def main():
     # Ganti dengan API key Anda
     API_KEY = 'f40723032cd619efc97acbc6a9a66272'
 
+    # Tampilkan progres pengecekan di console (library diam secara default)
+    configure_logging()
+
     # Inisialisasi checker untuk domain Gorontalo
     checker = BPSDataChecker(api_key=API_KEY, domain='7500')
 
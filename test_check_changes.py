@@ -0,0 +1,112 @@
+"""
+Test check_changes: baseline, delta added/removed/modified terhadap
+snapshot sebelumnya, dan pengambilan halaman yang berhenti di item lama
+"""
+
+import json
+import re
+from datetime import timedelta
+
+from bps_data_checker import BPSDataChecker
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+        self.status_code = 200
+        self.headers = {}
+        self.content = json.dumps(data).encode('utf-8')
+        self.elapsed = timedelta(0)
+
+    def json(self):
+        return self.data
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class CatalogSession:
+    """
+    Session yang melayani katalog news (diurutkan terbaru lebih dulu)
+    dengan per_page item per halaman dan mencatat halaman yang diminta
+    """
+
+    def __init__(self, items, per_page=2):
+        self.items = items
+        self.per_page = per_page
+        self.requested = []
+
+    def get(self, url, headers=None, timeout=None):
+        page = int(re.search(r'/page/(\d+)', url).group(1))
+        self.requested.append(page)
+        pages = max(1, -(-len(self.items) // self.per_page))
+        chunk = self.items[(page - 1) * self.per_page:page * self.per_page]
+        return FakeResponse({'status': 'OK', 'data': [{'page': page, 'pages': pages, 'total': len(self.items)},
+                                                      chunk]})
+
+
+def news(news_id, rl_date, title='Berita'):
+    return {'news_id': news_id, 'rl_date': rl_date, 'title': title}
+
+
+def run_changes(items, previous, per_page=2):
+    checker = BPSDataChecker(api_key='test', categories=['news'], max_retries=0)
+    checker.session = CatalogSession(items, per_page)
+    results = checker.check_changes(previous=previous)
+    return results['data_availability']['news'], checker.session.requested
+
+
+def snapshot(index, check_timestamp='2024-06-01 00:00:00'):
+    return {
+        'check_timestamp': check_timestamp,
+        'data_availability': {'news': {'status': 'success', 'item_index': index}},
+    }
+
+
+def test_first_run_is_baseline():
+    result, requested = run_changes([news(2, '2024-05-02'), news(1, '2024-05-01')], previous={})
+    assert result['changes'] == {'baseline': True, 'added': [], 'removed': [], 'modified': []}
+    assert result['item_index'] == {'2': '2024-05-02', '1': '2024-05-01'}
+    assert result['total'] == 2
+    assert requested == [1]
+
+
+def test_added_removed_and_modified_items():
+    previous = snapshot({'3': '2024-05-03', '2': '2024-05-02', '1': '2024-05-01'})
+    items = [news(4, '2024-06-04'), news(3, '2024-06-03', title='Berita diperbarui'), news(2, '2024-05-02')]
+
+    result, _ = run_changes(items, previous, per_page=10)
+    changes = result['changes']
+    assert changes['baseline'] is False
+    assert [item['news_id'] for item in changes['added']] == [4]
+    assert changes['removed'] == ['1']
+    assert [item['news_id'] for item in changes['modified']] == [3]
+
+
+def test_pages_older_than_previous_snapshot_are_not_fetched():
+    old = [news(i, '2024-01-%02d' % i) for i in range(4, 0, -1)]
+    previous = snapshot({str(item['news_id']): item['rl_date'] for item in old})
+    items = [news(6, '2024-06-06'), news(5, '2024-06-05')] + old
+
+    result, requested = run_changes(items, previous)
+    # Halaman 2 sudah lebih lama dari snapshot, halaman 3 tidak diambil
+    assert requested == [1, 2]
+    assert result['pages_fetched'] == 2
+    assert [item['news_id'] for item in result['changes']['added']] == [6, 5]
+    assert result['changes']['removed'] == []
+    assert len(result['item_index']) == 6
+
+
+def test_total_mismatch_refetches_all_pages_to_find_removed_items():
+    old = [news(i, '2024-01-%02d' % i) for i in range(4, 0, -1)]
+    previous = snapshot({str(item['news_id']): item['rl_date'] for item in old})
+    # Item 1 dihapus dari halaman lama: jumlah gabungan tidak cocok dengan total
+    items = [news(6, '2024-06-06'), news(5, '2024-06-05')] + old[:3]
+
+    result, requested = run_changes(items, previous)
+    assert requested == [1, 2, 1, 2, 3]
+    assert result['changes']['removed'] == ['1']
+    assert [item['news_id'] for item in result['changes']['added']] == [6, 5]
@@ -0,0 +1,131 @@
+"""
+Test CheckpointJournal: membaca ulang journal, baris terpotong, dan resume
+pengecekan kategori/halaman lewat BPSDataChecker
+"""
+
+import json
+import re
+from datetime import timedelta
+
+from bps_data_checker import BPSDataChecker, CheckpointJournal
+
+
+class FakeResponse:
+    def __init__(self, data, status_code=200):
+        self.data = data
+        self.status_code = status_code
+        self.headers = {}
+        self.content = json.dumps(data).encode('utf-8')
+        self.elapsed = timedelta(0)
+
+    def json(self):
+        return self.data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"status {self.status_code}")
+
+    def close(self):
+        pass
+
+
+class ListSession:
+    """
+    Session yang melayani list/model dengan 2 item per halaman dan mencatat
+    halaman yang diminta
+    """
+
+    def __init__(self, pages=2, failing=()):
+        self.pages = pages
+        self.failing = set(failing)
+        self.requested = []
+
+    def get(self, url, headers=None, timeout=None):
+        model, page = re.search(r'/list/model/(\w+)/.*/page/(\d+)', url).groups()
+        self.requested.append((model, int(page)))
+        if model in self.failing:
+            return FakeResponse({'status': 'Error'}, status_code=404)
+        items = [{'id': f'{model}-{page}-{i}'} for i in range(2)]
+        return FakeResponse({'status': 'OK', 'data': [{'page': int(page), 'pages': self.pages,
+                                                       'total': 2 * self.pages}, items]})
+
+
+def make_checker(journal, session, **kwargs):
+    checker = BPSDataChecker(api_key='test', journal=journal, max_retries=0, **kwargs)
+    checker.session = session
+    return checker
+
+
+def test_journal_reloads_results_and_pages(tmp_path):
+    path = str(tmp_path / 'checkpoint.ndjson')
+    journal = CheckpointJournal(path)
+    journal.record_result('7500', 'news', {'status': 'success', 'total_news': 3})
+    journal.record_page('7500', 'news', 2, {'data': [{}, [{'news_id': 1}]]})
+    journal.close()
+
+    resumed = CheckpointJournal(path, resume=True)
+    assert resumed.get_result('7500', 'news') == {'status': 'success', 'total_news': 3}
+    assert resumed.get_page('7500', 'news', 2) == {'data': [{}, [{'news_id': 1}]]}
+    assert resumed.get_result('7500', 'publications') is None
+    resumed.close()
+
+    fresh = CheckpointJournal(path, resume=False)
+    assert fresh.get_result('7500', 'news') is None
+    fresh.close()
+    with open(path, 'rb') as f:
+        assert f.read() == b''
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    path = str(tmp_path / 'checkpoint.ndjson')
+    journal = CheckpointJournal(path)
+    journal.record_result('7500', 'news', {'status': 'success'})
+    journal.close()
+    with open(path, 'ab') as f:
+        f.write(b'{"type": "result", "domain": "7500", "categ')
+
+    resumed = CheckpointJournal(path, resume=True)
+    assert resumed.get_result('7500', 'news') == {'status': 'success'}
+    # Entry baru tetap dapat ditambahkan setelah baris yang terpotong
+    resumed.record_result('7500', 'subjects', {'status': 'success'})
+    resumed.close()
+    assert CheckpointJournal(path).get_result('7500', 'subjects') == {'status': 'success'}
+
+
+def test_resume_skips_finished_categories_and_retries_errors(tmp_path):
+    path = str(tmp_path / 'checkpoint.ndjson')
+    first = make_checker(CheckpointJournal(path, resume=False), ListSession(pages=1, failing={'news'}),
+                         categories=['news', 'subjects'])
+    results = first.check_all_data_availability()
+    first.journal.close()
+    assert results['data_availability']['news']['status'] == 'error'
+    assert results['data_availability']['subjects']['status'] == 'success'
+
+    session = ListSession(pages=1)
+    second = make_checker(CheckpointJournal(path, resume=True), session, categories=['news', 'subjects'])
+    results = second.check_all_data_availability()
+    second.journal.close()
+
+    # Hanya kategori yang gagal yang diambil ulang
+    assert session.requested == [('news', 1)]
+    assert results['data_availability']['news']['status'] == 'success'
+    assert results['data_availability']['subjects']['total_subjects'] == 2
+
+
+def test_resume_reuses_fetched_pages_with_all_pages(tmp_path):
+    path = str(tmp_path / 'checkpoint.ndjson')
+    journal = CheckpointJournal(path, resume=False)
+    session = ListSession(pages=3)
+    checker = make_checker(journal, session, all_pages=True)
+    checker._fetch_page('news', 1)
+    checker._fetch_page('news', 2)
+    journal.close()
+
+    session = ListSession(pages=3)
+    checker = make_checker(CheckpointJournal(path, resume=True), session, all_pages=True)
+    items, total, _ = checker._fetch_list('news')
+    checker.journal.close()
+
+    assert session.requested == [('news', 3)]
+    assert [item['id'] for item in items] == [f'news-{page}-{i}' for page in (1, 2, 3) for i in range(2)]
+    assert total == 6
@@ -0,0 +1,170 @@
+"""
+Test RequestCoalescer: single-flight antar thread, penyebaran exception ke
+semua waiter, TTL memori, eviction LRU dan timeout waiter
+"""
+
+import threading
+import time
+
+import pytest
+
+import bps_data_checker
+from bps_data_checker import RequestCoalescer
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("kondisi tidak terpenuhi sebelum timeout")
+        time.sleep(0.005)
+
+
+class BlockingLoader:
+    """
+    Loader yang menunggu release() sebelum mengembalikan value (atau
+    melempar error), agar pemanggil lain sempat bergabung
+    """
+
+    def __init__(self, value=None, error=None):
+        self.value = value
+        self.error = error
+        self.calls = 0
+        self.event = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.event.wait(2.0)
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def release(self):
+        self.event.set()
+
+
+def start_callers(coalescer, key, loader, count, **kwargs):
+    """
+    Menjalankan coalescer.get di beberapa thread; hasil/exception dikumpulkan per thread
+    """
+    outcomes = []
+    lock = threading.Lock()
+
+    def run():
+        try:
+            outcome = coalescer.get(key, loader, **kwargs)
+        except Exception as e:
+            outcome = e
+        with lock:
+            outcomes.append(outcome)
+
+    threads = [threading.Thread(target=run, daemon=True) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, outcomes
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(bps_data_checker.time, 'monotonic', fake)
+    return fake
+
+
+def test_single_flight_for_concurrent_callers():
+    coalescer = RequestCoalescer()
+    value = {'data': [1, 2, 3]}
+    loader = BlockingLoader(value=value)
+
+    threads, outcomes = start_callers(coalescer, 'list/news', loader, 8)
+    wait_for(lambda: coalescer.stats['coalesced'] == 7)
+    loader.release()
+    for thread in threads:
+        thread.join(2.0)
+
+    assert loader.calls == 1
+    assert all(data is value for data, _ in outcomes)
+    assert sorted(str(source) for _, source in outcomes) == ['None'] + ['coalesced'] * 7
+    assert coalescer.stats == {'hits': 0, 'coalesced': 7, 'misses': 1}
+    assert coalescer.in_flight == {}
+
+
+def test_exception_reaches_every_waiter_and_is_not_cached():
+    coalescer = RequestCoalescer()
+    error = ConnectionError("gagal terhubung")
+    loader = BlockingLoader(error=error)
+
+    threads, outcomes = start_callers(coalescer, 'list/news', loader, 4)
+    wait_for(lambda: coalescer.stats['coalesced'] == 3)
+    loader.release()
+    for thread in threads:
+        thread.join(2.0)
+
+    assert loader.calls == 1
+    assert len(outcomes) == 4 and all(outcome is error for outcome in outcomes)
+    assert coalescer.entries == {} and coalescer.in_flight == {}
+
+    # Pemanggil berikutnya menjalankan loader lagi
+    assert coalescer.get('list/news', lambda: 'ok') == ('ok', None)
+
+
+def test_memory_entry_expires_after_ttl(clock):
+    coalescer = RequestCoalescer(ttl=30)
+    calls = []
+
+    def loader():
+        calls.append(clock.now)
+        return len(calls)
+
+    assert coalescer.get('list/news', loader) == (1, None)
+    clock.now += 29
+    assert coalescer.get('list/news', loader) == (1, 'memory')
+    clock.now += 2
+    assert coalescer.get('list/news', loader) == (2, None)
+    assert len(calls) == 2
+
+
+def test_zero_ttl_only_coalesces():
+    coalescer = RequestCoalescer(ttl=0)
+    assert coalescer.get('list/news', lambda: 1) == (1, None)
+    assert coalescer.get('list/news', lambda: 2) == (2, None)
+    assert coalescer.entries == {}
+
+
+def test_lru_eviction_at_max_entries():
+    coalescer = RequestCoalescer(max_entries=2)
+    coalescer.get('a', lambda: 'a1')
+    coalescer.get('b', lambda: 'b1')
+    # 'a' dipakai lagi sehingga 'b' menjadi entry yang paling lama tidak dipakai
+    assert coalescer.get('a', lambda: 'a2') == ('a1', 'memory')
+    coalescer.get('c', lambda: 'c1')
+
+    assert list(coalescer.entries) == ['a', 'c']
+    assert coalescer.get('b', lambda: 'b2') == ('b2', None)
+    assert list(coalescer.entries) == ['c', 'b']
+
+
+def test_waiter_timeout_leaves_leader_running():
+    coalescer = RequestCoalescer()
+    loader = BlockingLoader(value='ok')
+
+    leader_threads, leader_outcomes = start_callers(coalescer, 'list/news', loader, 1)
+    wait_for(lambda: coalescer.stats['misses'] == 1)
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        coalescer.get('list/news', loader, timeout=0.05)
+    assert time.monotonic() - start < 1.0
+
+    loader.release()
+    leader_threads[0].join(2.0)
+    assert leader_outcomes == [('ok', None)]
+    assert coalescer.get('list/news', loader) == ('ok', 'memory')
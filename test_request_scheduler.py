@@ -0,0 +1,174 @@
+"""
+Test RequestScheduler: deadline, slot cadangan interactive, giliran antar
+domain dan pelepasan slot di jalur error BPSDataChecker._request
+"""
+
+import threading
+import time
+
+import pytest
+
+from bps_data_checker import BPSDataChecker, RequestScheduler
+
+
+class FakeRateLimiter:
+    """
+    Pengganti RateLimiter: token hanya tersedia saat available True
+    """
+
+    def __init__(self, available=True, wait=0.01):
+        self.available = available
+        self.wait = wait
+        self.taken = 0
+
+    def try_acquire(self):
+        if self.available:
+            self.taken += 1
+            return 0.0
+        return self.wait
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("kondisi tidak terpenuhi sebelum timeout")
+        time.sleep(0.005)
+
+
+def start_waiter(scheduler, granted, priority, domain, rate_limiter=None):
+    """
+    Menjalankan acquire di thread terpisah dan menunggu sampai waiter masuk antrian
+    """
+    before = scheduler.waiting[priority]
+
+    def run():
+        scheduler.acquire(priority, domain, rate_limiter=rate_limiter)
+        granted.append((priority, domain))
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    wait_for(lambda: scheduler.waiting[priority] == before + 1)
+    return thread
+
+
+def test_deadline_expires_queued_request():
+    scheduler = RequestScheduler(max_in_flight=1, reserved_interactive=0)
+    scheduler.acquire('bulk', '7500')
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        scheduler.acquire('interactive', '7500', deadline=time.monotonic() + 0.05)
+    assert 0.04 <= time.monotonic() - start < 1.0
+    assert scheduler.stats['expired'] == 1
+    assert scheduler.waiting == {'interactive': 0, 'bulk': 0}
+
+    # Waiter yang dibatalkan tidak menahan antrian
+    scheduler.release()
+    scheduler.acquire('bulk', '1100', deadline=time.monotonic() + 0.5)
+    assert scheduler.in_flight == 1
+
+
+def test_reserved_slots_only_for_interactive():
+    scheduler = RequestScheduler(max_in_flight=2, reserved_interactive=1)
+    scheduler.acquire('bulk', '1100')
+
+    with pytest.raises(TimeoutError):
+        scheduler.acquire('bulk', '1200', deadline=time.monotonic() + 0.05)
+
+    scheduler.acquire('interactive', '7500', deadline=time.monotonic() + 0.05)
+    assert scheduler.in_flight == 2
+    assert scheduler.stats['granted'] == {'interactive': 1, 'bulk': 1}
+
+
+def test_interactive_before_bulk():
+    scheduler = RequestScheduler(max_in_flight=1, reserved_interactive=0)
+    scheduler.acquire('bulk', '1100')
+    granted = []
+    start_waiter(scheduler, granted, 'bulk', '1200')
+    start_waiter(scheduler, granted, 'interactive', '7500')
+
+    scheduler.release()
+    wait_for(lambda: len(granted) == 1)
+    assert granted == [('interactive', '7500')]
+
+
+def test_round_robin_between_domains():
+    scheduler = RequestScheduler(max_in_flight=1, reserved_interactive=0)
+    scheduler.acquire('bulk', 'setup')
+    granted = []
+    for domain in ('1100', '1100', '1100', '1200', '1300'):
+        start_waiter(scheduler, granted, 'bulk', domain)
+
+    for count in range(1, 6):
+        scheduler.release()
+        wait_for(lambda: len(granted) == count)
+    assert [domain for _, domain in granted] == ['1100', '1200', '1300', '1100', '1100']
+
+
+def test_token_taken_only_when_turn_arrives():
+    scheduler = RequestScheduler(max_in_flight=4, reserved_interactive=1)
+    limiter = FakeRateLimiter(available=False)
+    granted = []
+    start_waiter(scheduler, granted, 'bulk', '1100', rate_limiter=limiter)
+    start_waiter(scheduler, granted, 'interactive', '7500', rate_limiter=limiter)
+
+    # Token berikutnya diambil waiter interactive meskipun bulk datang lebih dulu
+    limiter.available = True
+    wait_for(lambda: len(granted) == 2)
+    assert granted[0] == ('interactive', '7500')
+    assert limiter.taken == 2
+
+
+class FakeSession:
+    """
+    Session yang setiap GET-nya memanggil fail()
+    """
+
+    def __init__(self, fail):
+        self.fail = fail
+        self.calls = 0
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls += 1
+        self.fail()
+
+
+def make_checker(scheduler, fail, **kwargs):
+    checker = BPSDataChecker(api_key='test', scheduler=scheduler, backoff_factor=0, **kwargs)
+    checker.session = FakeSession(fail)
+    return checker
+
+
+def test_slot_released_after_connection_error():
+    import requests
+
+    def fail():
+        raise requests.ConnectionError("gagal terhubung")
+
+    scheduler = RequestScheduler(max_in_flight=2)
+    checker = make_checker(scheduler, fail, max_retries=2)
+    with pytest.raises(requests.ConnectionError):
+        checker._request('http://127.0.0.1/list')
+    assert checker.session.calls == 3
+    assert scheduler.in_flight == 0
+
+
+def test_slot_released_after_unexpected_error():
+    def fail():
+        raise ValueError("response rusak")
+
+    scheduler = RequestScheduler(max_in_flight=2)
+    checker = make_checker(scheduler, fail)
+    result = checker.check_category('news', 5)
+    assert result['status'] == 'error'
+    assert scheduler.in_flight == 0
+
+
+def test_slot_released_when_deadline_passes_after_grant():
+    scheduler = RequestScheduler(max_in_flight=2)
+    checker = make_checker(scheduler, lambda: None).with_priority('interactive', timeout=0)
+    with pytest.raises(TimeoutError):
+        checker._request('http://127.0.0.1/list')
+    assert checker.session.calls == 0
+    assert scheduler.in_flight == 0
@@ -0,0 +1,111 @@
+"""
+Test ResponseCache: TTL per kategori, revalidasi bersyarat (ETag dan
+Last-Modified) lewat BPSDataChecker dan eviction berdasarkan ukuran
+"""
+
+import json
+from datetime import timedelta
+
+from bps_data_checker import BPSDataChecker, RequestMetrics, ResponseCache
+
+
+class FakeResponse:
+    def __init__(self, data=None, status_code=200, headers=None):
+        self.data = data
+        self.status_code = status_code
+        self.headers = dict(headers or {})
+        self.content = json.dumps(data).encode('utf-8') if data is not None else b''
+        self.elapsed = timedelta(0)
+
+    def json(self):
+        return self.data
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class ScriptedSession:
+    """
+    Session yang mengembalikan response sesuai urutan dan mencatat header setiap GET
+    """
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.headers.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+def list_data(total):
+    return {'status': 'OK', 'data': [{'page': 1, 'pages': 1, 'total': total}, [{'news_id': 1}]]}
+
+
+def make_checker(cache, session):
+    metrics = RequestMetrics()
+    checker = BPSDataChecker(api_key='test', cache=cache, request_hooks=[metrics], max_retries=0)
+    checker.session = session
+    return checker, metrics
+
+
+def test_fresh_entry_is_used_without_request(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'), ttl={'news': 600})
+    session = ScriptedSession(FakeResponse(list_data(1)))
+    checker, metrics = make_checker(cache, session)
+
+    assert checker.check_category('news', 5)['total_news'] == 1
+    assert checker.check_category('news', 5)['total_news'] == 1
+    assert len(session.headers) == 1
+    assert [entry['cache'] for entry in metrics.entries] == ['miss', 'hit']
+
+
+def test_expired_entry_is_revalidated_with_etag(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'), default_ttl=0)
+    session = ScriptedSession(
+        FakeResponse(list_data(1), headers={'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}),
+        FakeResponse(status_code=304),
+        FakeResponse(list_data(2), headers={'ETag': '"v2"'}),
+    )
+    checker, metrics = make_checker(cache, session)
+
+    assert checker.check_category('news', 5)['total_news'] == 1
+    # 304: data lama dipakai lagi tanpa body baru
+    assert checker.check_category('news', 5)['total_news'] == 1
+    assert session.headers[1] == {'If-None-Match': '"v1"', 'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+    # 200: data dan ETag baru disimpan
+    assert checker.check_category('news', 5)['total_news'] == 2
+    assert [entry['cache'] for entry in metrics.entries] == ['miss', 'revalidated', 'miss']
+
+    entry = cache.get(checker._cache_key(f"{checker.base_url}/list/model/news/domain/7500/key/test/page/1"), 'news')
+    assert entry['etag'] == '"v2"' and entry['last_modified'] is None
+    assert entry['value'] == list_data(2)
+
+
+def test_touch_makes_entry_fresh_again(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'), ttl={'news': 60})
+    cache.put('list/model/news', 'news', {'a': 1}, etag='"v1"')
+    with cache.lock:
+        cache.conn.execute("UPDATE responses SET stored_at = stored_at - 120")
+    assert cache.get('list/model/news', 'news')['fresh'] is False
+
+    cache.touch('list/model/news')
+    assert cache.get('list/model/news', 'news')['fresh'] is True
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'))
+    cache.put('a', 'news', {'value': 'a'})
+    cache.put('b', 'news', {'value': 'b'})
+    # 'b' paling lama tidak diakses; ruang cukup untuk dua entry
+    with cache.lock:
+        cache.conn.execute("UPDATE responses SET accessed_at = CASE key WHEN 'a' THEN 2 ELSE 1 END")
+        cache.max_size = cache.conn.execute("SELECT SUM(size) FROM responses").fetchone()[0]
+    cache.put('c', 'news', {'value': 'c'})
+
+    assert cache.get('b', 'news') is None
+    assert cache.get('a', 'news')['value'] == {'value': 'a'}
+    assert cache.get('c', 'news')['value'] == {'value': 'c'}